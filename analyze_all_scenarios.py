@@ -4,112 +4,336 @@ Comprehensive Scenario Analysis Script
 Generates year-by-year financial breakdown for all scenarios in config/scenarios/
 """
 
+import argparse
+import contextlib
+import csv
+import dataclasses
+import logging
 import os
+import pickle
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 import traceback
 
+import numpy as np
+
+# Numba is optional: without it the summary reduction runs as plain Python
+try:
+    from numba import njit
+    NUMBA_SUPPORT = True
+except ImportError:
+    NUMBA_SUPPORT = False
+
 # Add project root to path
 sys.path.append(str(Path(__file__).parent))
 
-from config.template_engine import TemplateEngine, GenericCalculationEngine
-from models.unified_financial_data import UnifiedFinancialScenario, UnifiedFinancialData
+from config import disk_cache
+
+logger = logging.getLogger(__name__)
+
+# The template engine (YAML, pydantic models) is imported on first use
+if TYPE_CHECKING:
+    import pandas as pd
+    from config.template_engine import TemplateEngine, GenericCalculationEngine
+    from models.unified_financial_data import UnifiedFinancialScenario
+
+# Files in config/scenarios that are not scenarios themselves
+EXCLUDED_SCENARIO_FILES = frozenset({"README.yaml", "template.yaml"})
+
+# Default location of the on-disk cache of calculated scenarios
+RESULT_CACHE_DIR = str(disk_cache.CACHE_ROOT / "scenarios")
+
+# Per-year monetary columns (GBP, rounded to whole pounds) in CSV order
+MONEY_COLUMNS = [
+    'gross_income', 'salary', 'bonus', 'rsu',
+    'total_tax', 'income_tax', 'social_security', 'net_income',
+    'housing_cost', 'living_expenses', 'total_expenses',
+    'investments_total', 'retirement', 'taxable_investments', 'housing_equity',
+    'net_worth', 'liquid_assets', 'illiquid_assets', 'liabilities',
+]
+
+# Positions of the _summarize() inputs within MONEY_COLUMNS
+SUMMARY_COLUMN_INDEXES = tuple(MONEY_COLUMNS.index(name) for name in (
+    'gross_income', 'net_income', 'total_tax', 'total_expenses', 'net_worth', 'investments_total',
+))
+
+# Full CSV row layout: scenario-level fields followed by the per-year columns
+CSV_FIELDS = (
+    'scenario_id', 'scenario_name', 'phase', 'is_multi_phase',
+    'year', 'age', 'jurisdiction', 'currency',
+    *MONEY_COLUMNS,
+)
+
+
+def _summarize(gross_income, net_income, total_tax, total_expenses, net_worth, investments_total):
+    """
+    Reduce a scenario's (non-empty) yearly columns to its summary figures.
+
+    Returns (starting_income, ending_income, final_net_worth, total_taxes_paid,
+    total_investments, avg_annual_savings). Written as an explicit loop so it
+    compiles to a single fused pass under Numba.
+    """
+    n = gross_income.shape[0]
+    taxes_paid = 0.0
+    savings = 0.0
+    for i in range(n):
+        taxes_paid += total_tax[i]
+        savings += net_income[i] - total_expenses[i]
+    return (gross_income[0], gross_income[n - 1], net_worth[n - 1],
+            taxes_paid, investments_total[n - 1], savings / n)
+
+
+if NUMBA_SUPPORT:
+    _summarize = njit(cache=True, fastmath=True)(_summarize)
+
+
+@dataclass
+class ScenarioSummary:
+    """Headline figures for one analyzed scenario (GBP)."""
+    starting_income: float = 0
+    ending_income: float = 0
+    final_net_worth: float = 0
+    total_taxes_paid: float = 0
+    total_investments: float = 0
+    avg_annual_savings: float = 0
+
+
+@dataclass
+class ScenarioRecord:
+    """
+    Analysis of one scenario.
+
+    yearly_data holds one tuple per year in CSV_FIELDS order (from 'year' on);
+    it is dropped once streamed to CSV.
+    """
+    scenario_id: str
+    name: str
+    description: str
+    phase: str
+    phases_count: int
+    is_multi_phase: bool
+    total_years: int
+    summary: ScenarioSummary
+    yearly_data: Optional[List[tuple]] = None
+
+
+@dataclass
+class ScenarioFailure:
+    """A scenario whose analysis raised an error."""
+    scenario_id: str
+    error: str
+    status: str = 'failed'
+
+
+ScenarioResult = Union[ScenarioRecord, ScenarioFailure]
+
+# ScenarioSummary field names, in declaration order
+SUMMARY_FIELDS = tuple(field.name for field in dataclasses.fields(ScenarioSummary))
 
 
 class ScenarioAnalyzer:
     """Comprehensive analyzer for all financial scenarios."""
     
-    def __init__(self, config_root: str = "config"):
+    def __init__(self, config_root: str = "config", cache_dir: Optional[str] = None,
+                 verbose: bool = True):
         """Initialize with template engine and calculator."""
-        self.template_engine = TemplateEngine(config_root)
-        self.calculator = GenericCalculationEngine(self.template_engine)
         self.config_root = Path(config_root)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.verbose = verbose
+        self._template_engine: Optional[TemplateEngine] = None
+        self._calculator: Optional[GenericCalculationEngine] = None
+        self._result_fingerprint: Optional[str] = None
+    
+    @property
+    def template_engine(self) -> "TemplateEngine":
+        """Template engine, created on first use."""
+        if self._template_engine is None:
+            from config.template_engine import TemplateEngine
+            # Resolved configs are persisted alongside the result cache
+            self._template_engine = TemplateEngine(str(self.config_root),
+                                                   persistent_cache=self.cache_dir is not None)
+        return self._template_engine
+    
+    @property
+    def calculator(self) -> "GenericCalculationEngine":
+        """Calculation engine, created on first use."""
+        if self._calculator is None:
+            from config.template_engine import GenericCalculationEngine
+            self._calculator = GenericCalculationEngine(self.template_engine)
+        return self._calculator
+    
+    def _log(self, message: str) -> None:
+        """Print a per-scenario progress line unless running quietly."""
+        if self.verbose:
+            print(message)
     
     def get_all_scenarios(self) -> List[str]:
         """Get list of all available scenario files."""
         scenario_dir = self.config_root / "scenarios"
         scenarios = []
         
-        # Get all YAML files in scenarios directory
-        for file in scenario_dir.glob("*.yaml"):
-            if file.name not in ["README.yaml", "template.yaml"]:
-                scenarios.append(file.stem)
+        # Get all YAML files in scenarios directory (scandir gives file type without extra stats)
+        with os.scandir(scenario_dir) as entries:
+            for entry in entries:
+                if (entry.name.endswith(".yaml") and entry.name not in EXCLUDED_SCENARIO_FILES
+                        and entry.is_file()):
+                    scenarios.append(entry.name[:-5])
         
         # Also check examples subdirectory
-        examples_dir = scenario_dir / "examples"
-        if examples_dir.exists():
-            for file in examples_dir.glob("*.yaml"):
-                scenarios.append(f"examples/{file.stem}")
+        try:
+            with os.scandir(scenario_dir / "examples") as entries:
+                for entry in entries:
+                    if entry.name.endswith(".yaml") and entry.is_file():
+                        scenarios.append(f"examples/{entry.name[:-5]}")
+        except FileNotFoundError:
+            pass
         
-        return sorted(scenarios)
+        scenarios.sort()
+        return scenarios
     
-    def analyze_scenario(self, scenario_id: str) -> Dict:
+    def analyze_scenario(self, scenario_id: str) -> ScenarioResult:
         """Analyze a single scenario and return year-by-year breakdown."""
         try:
-            # Load and calculate scenario
-            result = self.calculator.calculate_scenario_from_templates(scenario_id)
+            # Load scenario, reusing a cached calculation when its inputs are unchanged
+            config = self.template_engine.load_scenario(scenario_id)
+            result = self._load_cached_result(scenario_id)
+            if result is None:
+                result = self.calculator.calculate_scenario(config)
+                self._store_cached_result(scenario_id, result)
             
-            # Extract year-by-year data
-            yearly_data = []
-            for data_point in result.data_points:
-                yearly_data.append({
-                    'year': data_point.year,
-                    'age': data_point.age,
-                    'jurisdiction': data_point.jurisdiction.value,
-                    'currency': data_point.currency.value,
-                    'gross_income': round(data_point.income.total_gbp, 0),
-                    'salary': round(data_point.income.salary.gbp_value, 0),
-                    'bonus': round(data_point.income.bonus.gbp_value, 0),
-                    'rsu': round(data_point.income.rsu_vested.gbp_value, 0),
-                    'total_tax': round(data_point.tax.total_gbp, 0),
-                    'income_tax': round(data_point.tax.income_tax.gbp_value, 0),
-                    'social_security': round(data_point.tax.social_security.gbp_value, 0),
-                    'net_income': round(data_point.income.total_gbp - data_point.tax.total_gbp, 0),
-                    'housing_cost': round(data_point.expenses.housing.gbp_value, 0),
-                    'living_expenses': round(data_point.expenses.living.gbp_value, 0),
-                    'total_expenses': round(data_point.expenses.total_gbp, 0),
-                    'investments_total': round(data_point.investments.total_gbp, 0),
-                    'retirement': round(data_point.investments.retirement.gbp_value, 0),
-                    'taxable_investments': round(data_point.investments.taxable.gbp_value, 0),
-                    'housing_equity': round(data_point.investments.housing.gbp_value, 0),
-                    'net_worth': round(data_point.net_worth.total_gbp, 0),
-                    'liquid_assets': round(data_point.net_worth.liquid_assets.gbp_value, 0),
-                    'illiquid_assets': round(data_point.net_worth.illiquid_assets.gbp_value, 0),
-                    'liabilities': round(data_point.net_worth.liabilities.gbp_value, 0)
-                })
+            # Extract year-by-year data into columnar arrays (one row per year)
+            data_points = result.data_points
+            n = len(data_points)
+            years = np.empty(n, dtype=np.int64)
+            ages = np.empty(n, dtype=np.int64)
+            jurisdictions = [None] * n
+            currencies = [None] * n
+            # Enum -> string, resolved once per distinct member (a scenario has only a few)
+            jurisdiction_values = {}
+            currency_values = {}
+            # Column-major so each metric column is contiguous for _summarize
+            values = np.empty((n, len(MONEY_COLUMNS)), dtype=np.float64, order='F')
             
-            # Get scenario metadata
-            config = self.template_engine.load_scenario(scenario_id)
+            for i, data_point in enumerate(data_points):
+                income = data_point.income
+                tax = data_point.tax
+                expenses = data_point.expenses
+                investments = data_point.investments
+                net_worth = data_point.net_worth
+                gross_income = income.total_gbp
+                total_tax = tax.total_gbp
+                
+                years[i] = data_point.year
+                ages[i] = data_point.age
+                jurisdiction = data_point.jurisdiction
+                currency = data_point.currency
+                jurisdictions[i] = (jurisdiction_values.get(jurisdiction)
+                                    or jurisdiction_values.setdefault(jurisdiction, jurisdiction.value))
+                currencies[i] = (currency_values.get(currency)
+                                 or currency_values.setdefault(currency, currency.value))
+                values[i] = (
+                    gross_income,
+                    income.salary.gbp_value,
+                    income.bonus.gbp_value,
+                    income.rsu_vested.gbp_value,
+                    total_tax,
+                    tax.income_tax.gbp_value,
+                    tax.social_security.gbp_value,
+                    gross_income - total_tax,
+                    expenses.housing.gbp_value,
+                    expenses.living.gbp_value,
+                    expenses.total_gbp,
+                    investments.total_gbp,
+                    investments.retirement.gbp_value,
+                    investments.taxable.gbp_value,
+                    investments.housing.gbp_value,
+                    net_worth.total_gbp,
+                    net_worth.liquid_assets.gbp_value,
+                    net_worth.illiquid_assets.gbp_value,
+                    net_worth.liabilities.gbp_value,
+                )
             
-            return {
-                'scenario_id': scenario_id,
-                'name': result.name,
-                'description': result.description,
-                'phase': result.phase.value,
-                'phases_count': len(config.phases),
-                'is_multi_phase': config.is_multi_phase,
-                'total_years': len(yearly_data),
-                'yearly_data': yearly_data,
-                'summary': {
-                    'starting_income': yearly_data[0]['gross_income'] if yearly_data else 0,
-                    'ending_income': yearly_data[-1]['gross_income'] if yearly_data else 0,
-                    'final_net_worth': yearly_data[-1]['net_worth'] if yearly_data else 0,
-                    'total_taxes_paid': sum(year['total_tax'] for year in yearly_data),
-                    'total_investments': yearly_data[-1]['investments_total'] if yearly_data else 0,
-                    'avg_annual_savings': round(sum(year['net_income'] - year['total_expenses'] for year in yearly_data) / len(yearly_data), 0) if yearly_data else 0
-                }
-            }
+            # One vectorized pass rounds every value to whole pounds. It uses the
+            # same half-to-even rule as round(x, 0), so CSV output is unchanged,
+            # and the comparison table's ,.0f formatting needs no extra rounding.
+            np.round(values, 0, out=values)
+            
+            # CSV-ready rows straight from the columns (tolist() yields plain Python scalars)
+            yearly_data = list(zip(years.tolist(), ages.tolist(), jurisdictions, currencies,
+                                   *values.T.tolist()))
+            
+            if n:
+                (starting_income, ending_income, final_net_worth,
+                 total_taxes_paid, total_investments, avg_annual_savings) = _summarize(
+                    *(values[:, index] for index in SUMMARY_COLUMN_INDEXES)
+                )
+                summary = ScenarioSummary(
+                    starting_income=float(starting_income),
+                    ending_income=float(ending_income),
+                    final_net_worth=float(final_net_worth),
+                    total_taxes_paid=float(total_taxes_paid),
+                    total_investments=float(total_investments),
+                    avg_annual_savings=round(float(avg_annual_savings), 0)
+                )
+            else:
+                summary = ScenarioSummary()
+            
+            return ScenarioRecord(
+                scenario_id=scenario_id,
+                name=result.name,
+                description=result.description,
+                phase=result.phase.value,
+                phases_count=len(config.phases),
+                is_multi_phase=config.is_multi_phase,
+                total_years=n,
+                summary=summary,
+                yearly_data=yearly_data
+            )
             
         except Exception as e:
-            return {
-                'scenario_id': scenario_id,
-                'error': str(e),
-                'status': 'failed'
-            }
-    
-    def analyze_all_scenarios(self) -> Dict:
-        """Analyze all scenarios and return comprehensive results."""
+            return ScenarioFailure(scenario_id=scenario_id, error=str(e))
+    
+    def _dependency_fingerprint(self) -> str:
+        """Fingerprint of every file a scenario calculation can read: the YAML config and the Python sources."""
+        if self._result_fingerprint is None:
+            dependencies = sorted(self.config_root.rglob("*.yaml"))
+            dependencies += disk_cache.source_files()
+            self._result_fingerprint = disk_cache.fingerprint(dependencies, str(self.config_root.resolve()))
+        return self._result_fingerprint
+    
+    def _load_cached_result(self, scenario_id: str) -> Optional["UnifiedFinancialScenario"]:
+        """Return the cached calculation for a scenario, or None if missing or stale."""
+        if self.cache_dir is None:
+            return None
+        result = disk_cache.load(self.cache_dir, scenario_id, self._dependency_fingerprint())
+        return None if result is disk_cache.MISS else result
+    
+    def _store_cached_result(self, scenario_id: str, result: "UnifiedFinancialScenario") -> None:
+        """Persist a calculation, replacing any older entry for the scenario."""
+        if self.cache_dir is None:
+            return
+        try:
+            disk_cache.write(self.cache_dir, scenario_id, self._dependency_fingerprint(), result)
+        except (OSError, pickle.PicklingError):
+            logger.warning("Could not cache %s", scenario_id, exc_info=True)
+    
+    def analyze_all_scenarios(self, max_workers: Optional[int] = None,
+                              output_file: Optional[str] = None) -> Dict:
+        """
+        Analyze all scenarios and return comprehensive results.
+
+        Scenarios are independent, so with more than one worker they are
+        spread across a process pool (one worker per CPU by default); with a
+        single worker they run in this process. Results are consumed in
+        scenario order.
+
+        When output_file is given, each scenario's yearly rows are streamed to
+        that CSV as soon as its result arrives, and only the summary and
+        metadata are kept in the returned results.
+        """
         print("🔍 COMPREHENSIVE SCENARIO ANALYSIS")
         print("=" * 60)
         
@@ -118,24 +342,51 @@ class ScenarioAnalyzer:
         successful_count = 0
         failed_count = 0
         
-        for scenario_id in scenarios:
-            print(f"Analyzing {scenario_id}...")
-            result = self.analyze_scenario(scenario_id)
-            results[scenario_id] = result
-            
-            if 'error' in result:
-                failed_count += 1
-                print(f"  ❌ Failed: {result['error']}")
+        workers = max(1, min(max_workers or os.cpu_count() or 1, len(scenarios) or 1))
+        chunksize = max(1, len(scenarios) // (workers * 4))
+        
+        csv_file = None
+        writer = None
+        with contextlib.ExitStack() as stack:
+            if workers > 1:
+                executor = stack.enter_context(ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_PoolWorker.initialize,
+                    initargs=(str(self.config_root), str(self.cache_dir) if self.cache_dir else None)))
+                outcomes = executor.map(_PoolWorker.analyze, scenarios, chunksize=chunksize)
             else:
+                outcomes = map(self.analyze_scenario, scenarios)
+            
+            for scenario_id, result in zip(scenarios, outcomes):
+                self._log(f"Analyzing {scenario_id}...")
+                results[scenario_id] = result
+                
+                if isinstance(result, ScenarioFailure):
+                    failed_count += 1
+                    # Failures are always reported; name the scenario when progress lines are off
+                    print(f"  ❌ Failed: {result.error}" if self.verbose
+                          else f"❌ {scenario_id} failed: {result.error}")
+                    continue
+                
                 successful_count += 1
-                summary = result['summary']
-                print(f"  ✅ Success: {result['total_years']} years, "
-                      f"Final Net Worth: £{summary['final_net_worth']:,.0f}, "
-                      f"Phase: {result['phase']}")
+                self._log(f"  ✅ Success: {result.total_years} years, "
+                      f"Final Net Worth: £{result.summary.final_net_worth:,.0f}, "
+                      f"Phase: {result.phase}")
+                
+                if output_file:
+                    if writer is None:
+                        csv_file = stack.enter_context(open(output_file, 'w', newline='', encoding='utf-8'))
+                        writer = csv.writer(csv_file)
+                        writer.writerow(CSV_FIELDS)
+                    self._write_scenario_rows(writer, scenario_id, result)
+                    result.yearly_data = None
         
         print("=" * 60)
         print(f"📊 SUMMARY: {successful_count} successful, {failed_count} failed out of {len(scenarios)} total scenarios")
         
+        if csv_file is not None:
+            print(f"📁 Exported detailed data to {output_file}")
+        
         return {
             'total_scenarios': len(scenarios),
             'successful': successful_count,
@@ -144,76 +395,98 @@ class ScenarioAnalyzer:
         }
     
     def export_to_csv(self, results: Dict, output_file: str = "scenario_analysis.csv"):
-        """Export all scenario data to CSV format."""
-        import csv
-        
-        # Prepare CSV data
-        csv_data = []
-        headers_written = False
-        
-        for scenario_id, data in results['results'].items():
-            if 'error' in data:
-                continue
-                
-            for year_data in data['yearly_data']:
-                row = {
-                    'scenario_id': scenario_id,
-                    'scenario_name': data['name'],
-                    'phase': data['phase'],
-                    'is_multi_phase': data['is_multi_phase'],
-                    **year_data
-                }
-                csv_data.append(row)
+        """Export all scenario data still held in results to CSV format."""
+        exported = [(scenario_id, data) for scenario_id, data in results['results'].items()
+                    if isinstance(data, ScenarioRecord) and data.yearly_data is not None]
         
         # Write CSV
-        if csv_data:
+        if exported:
             with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = csv_data[0].keys()
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(csv_data)
+                writer = csv.writer(csvfile)
+                writer.writerow(CSV_FIELDS)
+                for scenario_id, data in exported:
+                    self._write_scenario_rows(writer, scenario_id, data)
             
             print(f"📁 Exported detailed data to {output_file}")
     
+    def _write_scenario_rows(self, writer, scenario_id: str, data: ScenarioRecord) -> None:
+        """Write one CSV row per year of an analyzed scenario, in CSV_FIELDS order."""
+        prefix = (scenario_id, data.name, data.phase, data.is_multi_phase)
+        writer.writerows(prefix + year_row
+                         for year_row in data.yearly_data)
+    
+    def summary_frame(self, results: Dict) -> "pd.DataFrame":
+        """
+        One row per successful scenario (indexed by scenario_id) with its metadata
+        and summary figures, for vectorized cross-scenario comparisons.
+        """
+        import pandas as pd
+        
+        records = [data for data in results['results'].values() if isinstance(data, ScenarioRecord)]
+        columns = {
+            'name': [record.name for record in records],
+            'phase': [record.phase for record in records],
+            'is_multi_phase': [record.is_multi_phase for record in records],
+            'total_years': [record.total_years for record in records],
+        }
+        for field in SUMMARY_FIELDS:
+            columns[field] = np.fromiter((getattr(record.summary, field) for record in records),
+                                         dtype=np.float64, count=len(records))
+        return pd.DataFrame(columns, index=pd.Index([record.scenario_id for record in records],
+                                                    name='scenario_id'))
+    
     def print_scenario_comparison(self, results: Dict):
         """Print a comparison table of key metrics across scenarios."""
         print("\n🏆 SCENARIO COMPARISON TABLE")
         print("=" * 80)
         
-        successful_results = {k: v for k, v in results['results'].items() if 'error' not in v}
+        # Successful scenarios by final net worth (a stable sort keeps scenario order for ties)
+        frame = self.summary_frame(results).sort_values('final_net_worth', ascending=False, kind='stable')
         
         # Header
         print(f"{'Scenario':<25} {'Type':<12} {'Final Income':<15} {'Net Worth':<15} {'Total Tax':<12}")
         print("-" * 80)
         
-        # Sort by final net worth
-        sorted_scenarios = sorted(successful_results.items(), 
-                                key=lambda x: x[1]['summary']['final_net_worth'], 
-                                reverse=True)
-        
-        for scenario_id, data in sorted_scenarios:
-            summary = data['summary']
-            scenario_type = "Multi-phase" if data['is_multi_phase'] else "Single-phase"
+        for row in frame.itertuples():
+            scenario_type = "Multi-phase" if row.is_multi_phase else "Single-phase"
             
-            print(f"{scenario_id:<25} {scenario_type:<12} "
-                  f"£{summary['ending_income']:>8,.0f}      "
-                  f"£{summary['final_net_worth']:>8,.0f}      "
-                  f"£{summary['total_taxes_paid']:>8,.0f}")
+            print(f"{row.Index:<25} {scenario_type:<12} "
+                  f"£{row.ending_income:>8,.0f}      "
+                  f"£{row.final_net_worth:>8,.0f}      "
+                  f"£{row.total_taxes_paid:>8,.0f}")
+
+
+class _PoolWorker:
+    """Per-process analyzer for the worker pool used by analyze_all_scenarios."""
+
+    analyzer: Optional[ScenarioAnalyzer] = None
+
+    @classmethod
+    def initialize(cls, config_root: str, cache_dir: Optional[str] = None) -> None:
+        """Create this worker process's analyzer (its engine is still built on first use)."""
+        cls.analyzer = ScenarioAnalyzer(config_root, cache_dir)
+
+    @classmethod
+    def analyze(cls, scenario_id: str) -> ScenarioResult:
+        """Analyze one scenario with this worker's analyzer."""
+        return cls.analyzer.analyze_scenario(scenario_id)
 
 
 def main():
     """Main execution function."""
-    analyzer = ScenarioAnalyzer()
+    parser = argparse.ArgumentParser(description="Analyze every scenario in config/scenarios/")
+    parser.add_argument("-q", "--quiet", action="store_true",
+                        help="only report failures, the summary and the comparison table")
+    args = parser.parse_args()
     
-    # Analyze all scenarios
-    results = analyzer.analyze_all_scenarios()
+    analyzer = ScenarioAnalyzer(cache_dir=RESULT_CACHE_DIR, verbose=not args.quiet)
+    
+    # Analyze all scenarios, streaming the year-by-year rows to CSV
+    results = analyzer.analyze_all_scenarios(output_file="scenario_analysis.csv")
     
     # Print comparison table
     analyzer.print_scenario_comparison(results)
     
-    # Export to CSV
-    analyzer.export_to_csv(results)
-    
     print(f"\n✅ Analysis complete! Check 'scenario_analysis.csv' for detailed year-by-year data.")
     
     return results
@@ -3,15 +3,39 @@ Scenario selector components for the financial planning dashboard.
 Provides interactive filtering and selection capabilities with template-driven discovery.
 """
 
+import functools
+import logging
+from itertools import islice
 import streamlit as st
 from typing import Dict, List, Optional, Any, Tuple, Set
 from utils.data import (
-    get_scenario_metadata,
+    get_available_scenarios,
+    get_scenario_id_groups,
     get_enriched_scenario_metadata,
     validate_all_scenarios,
     get_template_configuration_summary
 )
-from financial_planner_template_driven import TemplateFinancialPlanner
+
+logger = logging.getLogger(__name__)
+
+# Multiselect label prefix: validation icon (scenarios load successfully) and default phase icon
+OPTION_LABEL_PREFIX = "✅ 📊 "
+
+# Basic filter choices and their selectbox positions
+PHASE_OPTIONS = ('all', 'UK', 'International', 'Multi-Phase')
+JURISDICTION_OPTIONS = ('all', 'UK', 'US', 'UAE', 'Multi-jurisdiction')
+TEMPLATE_TYPE_OPTIONS = ('all', 'salary_progression', 'housing_strategy', 'investment_strategy', 'tax_system')
+VALIDATION_OPTIONS = ('all', 'valid_only', 'invalid_only', 'unknown')
+_PHASE_INDEX = {option: i for i, option in enumerate(PHASE_OPTIONS)}
+_JURISDICTION_INDEX = {option: i for i, option in enumerate(JURISDICTION_OPTIONS)}
+_TEMPLATE_TYPE_INDEX = {option: i for i, option in enumerate(TEMPLATE_TYPE_OPTIONS)}
+_VALIDATION_INDEX = {option: i for i, option in enumerate(VALIDATION_OPTIONS)}
+
+
+@functools.lru_cache(maxsize=1024)
+def _pretty(key: str) -> str:
+    """Format a snake_case ID or key for display (memoized across reruns)."""
+    return key.replace('_', ' ').title()
 
 
 def render_scenario_selector() -> None:
@@ -19,8 +43,7 @@ def render_scenario_selector() -> None:
 
     try:
         # Simplified approach: Get scenarios directly without expensive metadata
-        planner = TemplateFinancialPlanner()
-        all_scenarios = planner.get_available_scenarios()
+        all_scenarios = get_available_scenarios()
 
         # Initialize empty metadata and validation to avoid hangs
         enriched_metadata = {}
@@ -40,22 +63,19 @@ def render_scenario_selector() -> None:
         st.sidebar.text(f"Available: {len(all_scenarios)}")
         st.sidebar.text(f"In session: {len(st.session_state.selected_scenarios)}")
 
-        # Set default selection to all scenarios if none selected
-        if (not st.session_state.selected_scenarios or
-            len(st.session_state.selected_scenarios) == 0) and all_scenarios:
-            st.session_state.selected_scenarios = all_scenarios.copy()
-            st.sidebar.success(f"✅ Auto-selected {len(all_scenarios)} scenarios")
-
-        # Check for mismatched scenarios and clean up selection
-        mismatched = [s for s in st.session_state.selected_scenarios if s not in all_scenarios]
-        if mismatched:
-            st.sidebar.warning(f"⚠️ Removing {len(mismatched)} invalid scenarios")
-            st.session_state.selected_scenarios = [s for s in st.session_state.selected_scenarios if s in all_scenarios]
+        # Check for mismatched scenarios and clean up selection (set lookups; the
+        # cleaned list is only built when something actually needs removing)
+        available = frozenset(all_scenarios)
+        selected = st.session_state.selected_scenarios
+        mismatched_count = sum(1 for s in selected if s not in available)
+        if mismatched_count:
+            st.sidebar.warning(f"⚠️ Removing {mismatched_count} invalid scenarios")
+            st.session_state.selected_scenarios = [s for s in selected if s in available]
 
-        # If no scenarios are selected after filtering, select all available
+        # Default to all scenarios when nothing (valid) is selected
         if not st.session_state.selected_scenarios and all_scenarios:
-            st.session_state.selected_scenarios = all_scenarios.copy()
-            st.sidebar.info(f"🔄 Reset to all {len(all_scenarios)} scenarios")
+            st.session_state.selected_scenarios = list(all_scenarios)
+            st.sidebar.success(f"✅ Auto-selected {len(all_scenarios)} scenarios")
 
         # Enhanced scenario selection with template metadata
         st.sidebar.markdown("### 🎯 Scenario Selection")
@@ -68,13 +88,14 @@ def render_scenario_selector() -> None:
             all_scenarios, enriched_metadata, validation_status
         )
 
-        # Update session state if selection changed
-        if selected_scenarios != st.session_state.selected_scenarios:
+        # Update session state only if the selection changed; a reorder in the
+        # multiselect alone must not rewrite state (that would reset the widget)
+        if frozenset(selected_scenarios) != frozenset(st.session_state.selected_scenarios):
             st.session_state.selected_scenarios = selected_scenarios
             st.sidebar.success(f"✅ Updated selection: {len(selected_scenarios)} scenarios")
 
         # Show enhanced selection summary
-        render_selection_summary(selected_scenarios, enriched_metadata, validation_status)
+        render_selection_summary(selected_scenarios, enriched_metadata, validation_status, all_scenarios)
 
         # Template composition viewer for selected scenarios
         if selected_scenarios:
@@ -101,52 +122,49 @@ def render_template_filters(enriched_metadata: Dict[str, Dict], validation_statu
             'show_composition': False
         }
 
-    # Simplified phase filter
-    phase_options = ['all', 'UK', 'International', 'Multi-Phase']
+    template_filters = st.session_state.template_filters
 
+    # Simplified phase filter (unknown saved values fall back to 'all')
     phase_filter = st.sidebar.selectbox(
         "Filter by Phase",
-        options=phase_options,
-        index=phase_options.index(st.session_state.template_filters['phase_filter']),
+        options=PHASE_OPTIONS,
+        index=_PHASE_INDEX.get(template_filters['phase_filter'], 0),
         help="Filter scenarios by their phase type (UK only, international, etc.)"
     )
 
     # Jurisdiction filter (derived from scenario metadata)
-    jurisdiction_options = ['all', 'UK', 'US', 'UAE', 'Multi-jurisdiction']
     jurisdiction_filter = st.sidebar.selectbox(
         "Filter by Jurisdiction",
-        options=jurisdiction_options,
-        index=jurisdiction_options.index(st.session_state.template_filters['jurisdiction_filter']),
+        options=JURISDICTION_OPTIONS,
+        index=_JURISDICTION_INDEX.get(template_filters['jurisdiction_filter'], 0),
         help="Filter scenarios by primary jurisdiction"
     )
 
     # Template type filter
-    template_type_options = ['all', 'salary_progression', 'housing_strategy', 'investment_strategy', 'tax_system']
     template_type_filter = st.sidebar.selectbox(
         "Filter by Template Type",
-        options=template_type_options,
-        index=template_type_options.index(st.session_state.template_filters['template_type_filter']),
+        options=TEMPLATE_TYPE_OPTIONS,
+        index=_TEMPLATE_TYPE_INDEX.get(template_filters['template_type_filter'], 0),
         help="Filter scenarios by included template types"
     )
 
     # Validation filter
-    validation_options = ['all', 'valid_only', 'invalid_only', 'unknown']
     validation_filter = st.sidebar.selectbox(
         "Filter by Validation Status",
-        options=validation_options,
-        index=validation_options.index(st.session_state.template_filters['validation_filter']),
+        options=VALIDATION_OPTIONS,
+        index=_VALIDATION_INDEX.get(template_filters['validation_filter'], 0),
         help="Filter scenarios by template validation status"
     )
 
     # Template composition viewer toggle
     show_composition = st.sidebar.checkbox(
         "Show Template Composition",
-        value=st.session_state.template_filters['show_composition'],
+        value=template_filters['show_composition'],
         help="Display template composition details for each scenario"
     )
 
     # Update session state
-    st.session_state.template_filters.update({
+    template_filters.update({
         'phase_filter': phase_filter,
         'jurisdiction_filter': jurisdiction_filter,
         'template_type_filter': template_type_filter,
@@ -160,52 +178,47 @@ def render_enhanced_multiselect(all_scenarios: List[str],
                                validation_status: Dict) -> List[str]:
     """Render enhanced multi-select dropdown with simplified handling to avoid hangs."""
 
-    try:
-        # Simplified approach: Use scenario IDs directly as display names
-        scenario_options = []
-        scenario_id_map = {}
-
-        for scenario_id in all_scenarios:
-            display_name = scenario_id.replace('_', ' ').title()  # Make it more readable
-
-            # Use green checkmark since scenarios are loading successfully
-            validation_icon = "✅"  # Success icon since scenarios are working
-            phase_icon = "📊"  # Default icon
-
-            # Create display option
-            option_label = f"{validation_icon} {phase_icon} {display_name}"
-            scenario_options.append(option_label)
-            scenario_id_map[option_label] = scenario_id
-
-        # Convert current selection (IDs) to display format
-        current_selection_display = []
-        for scenario_id in st.session_state.selected_scenarios:
-            display_name = scenario_id.replace('_', ' ').title()
-            # Find the matching option with icons
-            for option in scenario_options:
-                if display_name in option:
-                    current_selection_display.append(option)
-                    break
-
-        # Render multiselect
-        selected_options = st.multiselect(
-            "Select scenarios to analyze:",
-            options=scenario_options,
-            default=current_selection_display,
-            help="Choose which scenarios to include in your analysis. ✅=Successfully loaded, 📊=Ready for analysis"
+    # Simplified approach: Use scenario IDs directly as display names. The
+    # option labels depend only on the scenario list, so reuse the previous
+    # rerun's labels until that list changes.
+    options_key = tuple(all_scenarios)
+    cached_options = st.session_state.get('_scenario_option_cache')
+    if cached_options is not None and cached_options[0] == options_key:
+        _, scenario_options, scenario_id_map, id_to_label = cached_options
+    else:
+        id_to_label: Dict[str, str] = {
+            scenario_id: OPTION_LABEL_PREFIX + _pretty(scenario_id)  # Make it more readable
+            for scenario_id in all_scenarios
+        }
+        scenario_options = list(id_to_label.values())
+        scenario_id_map = {label: scenario_id for scenario_id, label in id_to_label.items()}
+
+        st.session_state._scenario_option_cache = (
+            options_key, scenario_options, scenario_id_map, id_to_label
         )
 
-        # Convert selected options back to scenario IDs
-        selected_scenario_ids = [scenario_id_map.get(option, option) for option in selected_options]
+    # Convert current selection (IDs) to display format
+    current_selection_display = [
+        id_to_label[scenario_id]
+        for scenario_id in st.session_state.selected_scenarios
+        if scenario_id in id_to_label
+    ]
+
+    # Render multiselect
+    selected_options = st.multiselect(
+        "Select scenarios to analyze:",
+        options=scenario_options,
+        default=current_selection_display,
+        help="Choose which scenarios to include in your analysis. ✅=Successfully loaded, 📊=Ready for analysis"
+    )
 
-        print(f"DEBUG: Selected options: {selected_options}")
-        print(f"DEBUG: Mapped to IDs: {selected_scenario_ids}")
+    # Convert selected options back to scenario IDs
+    selected_scenario_ids = [scenario_id_map.get(option, option) for option in selected_options]
 
-        return selected_scenario_ids
+    logger.debug("Selected options: %s", selected_options)
+    logger.debug("Mapped to IDs: %s", selected_scenario_ids)
 
-    except Exception as e:
-        st.error(f"Failed to render enhanced multiselect: {str(e)}")
-        return st.session_state.selected_scenarios
+    return selected_scenario_ids
 
 
 def apply_template_filters(
@@ -216,7 +229,8 @@ def apply_template_filters(
     """Apply template-based filters to scenario list."""
 
     filters = st.session_state.template_filters
-    filtered_scenarios = all_scenarios.copy()
+    # Each active filter rebinds to a new list, so the input never needs copying
+    filtered_scenarios = all_scenarios
 
     # Apply phase filter
     if filters['phase_filter'] != 'all':
@@ -282,7 +296,8 @@ def _matches_validation_filter(scenario_id: str, validation_status: Dict, filter
 def render_selection_summary(
     selected_scenarios: List[str],
     enriched_metadata: Dict[str, Dict],
-    validation_status: Dict[str, Dict]
+    validation_status: Dict[str, Dict],
+    all_scenarios: List[str]
 ) -> None:
     """Render enhanced selection summary with template metadata."""
 
@@ -309,8 +324,7 @@ def render_selection_summary(
     col1, col2 = st.sidebar.columns(2)
     with col1:
         if st.button("Select All", help="Select all available scenarios", use_container_width=True):
-            metadata = get_scenario_metadata()
-            st.session_state.selected_scenarios = metadata['all_scenarios'].copy()
+            st.session_state.selected_scenarios = list(all_scenarios)
             st.rerun()
 
     with col2:
@@ -330,7 +344,7 @@ def render_template_composition_viewer(
 
     st.sidebar.markdown("#### 🧩 Template Composition")
 
-    for scenario_id in selected_scenarios[:3]:  # Limit to first 3 to avoid clutter
+    for scenario_id in islice(selected_scenarios, 3):  # Limit to first 3 to avoid clutter
         meta = enriched_metadata.get(scenario_id, {})
 
         if 'error' in meta:
@@ -341,18 +355,22 @@ def render_template_composition_viewer(
             composition = meta.get('template_composition', {})
             config_summary = meta.get('configuration_summary', {})
 
-            # Template components
-            st.markdown("**Template Components:**")
-            for component_type, template_name in composition.items():
-                if template_name and template_name != 'Unknown':
-                    st.markdown(f"• **{component_type.title()}**: {template_name}")
+            # Template components (one markdown element per section, hard line breaks between bullets)
+            component_lines = [
+                f"• **{component_type.title()}**: {template_name}"
+                for component_type, template_name in composition.items()
+                if template_name and template_name != 'Unknown'
+            ]
+            st.markdown("  \n".join(["**Template Components:**", *component_lines]))
 
             # Key configuration
             if config_summary:
-                st.markdown("**Configuration:**")
-                for key, value in config_summary.items():
-                    if value and value != 'Unknown':
-                        st.markdown(f"• **{key.replace('_', ' ').title()}**: {value}")
+                config_lines = [
+                    f"• **{_pretty(key)}**: {value}"
+                    for key, value in config_summary.items()
+                    if value and value != 'Unknown'
+                ]
+                st.markdown("  \n".join(["**Configuration:**", *config_lines]))
 
 
 def render_validation_status_panel() -> None:
@@ -401,45 +419,50 @@ def render_quick_filters() -> None:
 
     st.sidebar.markdown("#### ⚡ Quick Filters")
 
-    # Quick filter checkboxes
-    col1, col2 = st.sidebar.columns(2)
+    quick_filters = st.session_state.quick_filters
+    previous = (
+        quick_filters.get('uk_only', False),
+        quick_filters.get('international_only', False),
+        quick_filters.get('tax_free_only', False),
+        quick_filters.get('delayed_relocation_only', False)
+    )
+
+    # Quick filter checkboxes, batched in a form so toggling several filters
+    # costs one rerun (on "Apply Filters") instead of one per checkbox
+    form = st.sidebar.form("quick_filters_form")
+    col1, col2 = form.columns(2)
 
     with col1:
         uk_only = st.checkbox(
             "UK Only",
-            value=st.session_state.quick_filters.get('uk_only', False),
+            value=previous[0],
             help="Show only UK scenarios"
         )
 
         international_only = st.checkbox(
             "International",
-            value=st.session_state.quick_filters.get('international_only', False),
+            value=previous[1],
             help="Show only international scenarios"
         )
 
     with col2:
         tax_free_only = st.checkbox(
             "Tax-Free",
-            value=st.session_state.quick_filters.get('tax_free_only', False),
+            value=previous[2],
             help="Show only tax-free scenarios (UAE)"
         )
 
         delayed_relocation_only = st.checkbox(
             "Multi-Phase",
-            value=st.session_state.quick_filters.get('delayed_relocation_only', False),
+            value=previous[3],
             help="Show only multi-phase scenarios"
         )
 
-    # Update session state and apply filters if changed
-    filters_changed = (
-        uk_only != st.session_state.quick_filters.get('uk_only', False) or
-        international_only != st.session_state.quick_filters.get('international_only', False) or
-        tax_free_only != st.session_state.quick_filters.get('tax_free_only', False) or
-        delayed_relocation_only != st.session_state.quick_filters.get('delayed_relocation_only', False)
-    )
+    submitted = form.form_submit_button("Apply Filters", use_container_width=True)
 
-    if filters_changed:
-        st.session_state.quick_filters.update({
+    # Update session state and apply filters on submit
+    if submitted:
+        quick_filters.update({
             'uk_only': uk_only,
             'international_only': international_only,
             'tax_free_only': tax_free_only,
@@ -454,45 +477,34 @@ def apply_quick_filters() -> None:
 
     try:
         # Simplified approach: Get scenarios directly
-        planner = TemplateFinancialPlanner()
-        all_scenarios = planner.get_available_scenarios()
+        all_scenarios = get_available_scenarios()
         filters = st.session_state.quick_filters
+        groups = get_scenario_id_groups()
+
+        # Union of the precomputed ID groups for every active filter
+        if any(filters.values()):
+            filtered_set = set()
+            if filters.get('uk_only', False):
+                filtered_set |= groups['uk_set']
+            if filters.get('international_only', False):
+                filtered_set |= groups['international_set']
+            if filters.get('tax_free_only', False):
+                filtered_set |= groups['tax_free_set']
+            if filters.get('delayed_relocation_only', False):
+                filtered_set |= groups['multi_phase_set']
+        else:
+            # If no filters are active, show all scenarios
+            filtered_set = groups['all_scenarios_set']
 
-        # Get filtered scenarios based on quick filters using scenario ID patterns
-        filtered_scenarios = []
-
-        if filters.get('uk_only', False):
-            # Filter scenarios that contain 'uk' in the name
-            uk_scenarios = [s for s in all_scenarios if 'uk' in s.lower()]
-            filtered_scenarios.extend(uk_scenarios)
-
-        if filters.get('international_only', False):
-            # Filter scenarios that contain international locations
-            intl_scenarios = [s for s in all_scenarios if any(loc in s.lower() for loc in ['seattle', 'new_york', 'dubai'])]
-            filtered_scenarios.extend(intl_scenarios)
-
-        if filters.get('tax_free_only', False):
-            # Filter for UAE/Dubai scenarios
-            tax_free_scenarios = [s for s in all_scenarios if 'dubai' in s.lower()]
-            filtered_scenarios.extend(tax_free_scenarios)
-
-        if filters.get('delayed_relocation_only', False):
-            # Filter scenarios that contain 'year' (multi-phase scenarios)
-            delayed_scenarios = [s for s in all_scenarios if 'year' in s.lower()]
-            filtered_scenarios.extend(delayed_scenarios)
-
-        # If no filters are active, show all scenarios
-        if not any(filters.values()):
-            filtered_scenarios = all_scenarios
-
-        # Remove duplicates and update selection
-        filtered_scenarios = list(set(filtered_scenarios))
+        # Update selection (set lookups against the filtered IDs)
         current_selected = st.session_state.selected_scenarios
-        new_selected = [s for s in current_selected if s in filtered_scenarios]
+        new_selected = [s for s in current_selected if s in filtered_set]
 
         # If no scenarios are selected after filtering, select the first available
-        if not new_selected and filtered_scenarios:
-            new_selected = [filtered_scenarios[0]]
+        if not new_selected:
+            first_match = next((s for s in all_scenarios if s in filtered_set), None)
+            if first_match is not None:
+                new_selected = [first_match]
 
         st.session_state.selected_scenarios = new_selected
 
@@ -575,7 +587,7 @@ def render_scenario_info(scenario_name: str) -> None:
                 st.markdown("**Planning Parameters:**")
                 for key, value in scenario_params.items():
                     if value:
-                        st.markdown(f"• {key.replace('_', ' ').title()}: {value}")
+                        st.markdown(f"• {_pretty(key)}: {value}")
 
             # Template files
             template_files = config.get('template_files', {})
@@ -583,7 +595,7 @@ def render_scenario_info(scenario_name: str) -> None:
                 st.markdown("**Template Sources:**")
                 for template_type, template_file in template_files.items():
                     if template_file:
-                        st.markdown(f"• {template_type.replace('_', ' ').title()}: `{template_file}`")
+                        st.markdown(f"• {_pretty(template_type)}: `{template_file}`")
 
     except Exception as e:
         st.error(f"Failed to load scenario information: {str(e)}")
@@ -601,9 +613,8 @@ def render_year_range_slider() -> None:
         help="Filter data to show only selected years"
     )
 
-    if year_range != st.session_state.year_range:
-        st.session_state.year_range = year_range
-        st.rerun()
+    # Streamlit reruns once when the slider is released; storing the value is enough
+    st.session_state.year_range = year_range
 
     if year_range[0] == year_range[1]:
         st.sidebar.caption(f"Showing data for Year {year_range[0]}")
@@ -620,9 +631,9 @@ def render_comparison_mode() -> None:
         help="Enable side-by-side scenario comparison"
     )
 
-    if comparison_mode != st.session_state.get('comparison_mode', False):
-        st.session_state.comparison_mode = comparison_mode
-        st.rerun()
+    # The checkbox change has already triggered this rerun, and the sidebar renders
+    # before the page body reads the flag, so no second st.rerun() is needed
+    st.session_state.comparison_mode = comparison_mode
 
 
 def render_scenario_groups() -> None:
@@ -3,13 +3,17 @@ Utility functions for the financial planning dashboard.
 Includes formatting, color management, and helper functions.
 """
 
-from typing import Dict, List, Any, Tuple, Union
-import locale
+from typing import Dict, List, Any, NamedTuple, Tuple, Union
+import functools
+from itertools import islice
+
+# Symbols prefixed by format_currency; other currencies are shown as plain numbers
+CURRENCY_SYMBOLS = {"GBP": "£", "USD": "$"}
 
 
 def format_currency(amount: float, currency: str = "GBP") -> str:
     """
-    Format currency amounts with proper locale formatting.
+    Format currency amounts with thousands separators.
     
     Args:
         amount: Amount to format
@@ -18,19 +22,8 @@ def format_currency(amount: float, currency: str = "GBP") -> str:
     Returns:
         Formatted currency string
     """
-    try:
-        # Set locale for proper formatting
-        locale.setlocale(locale.LC_ALL, 'en_GB.UTF-8')
-    except:
-        # Fallback if locale not available
-        pass
-    
-    if currency == "GBP":
-        return f"£{amount:,.0f}"
-    elif currency == "USD":
-        return f"${amount:,.0f}"
-    else:
-        return f"{amount:,.0f}"
+    # The ',' format spec groups thousands independently of the process locale
+    return f"{CURRENCY_SYMBOLS.get(currency, '')}{amount:,.0f}"
 
 
 def format_percentage(value: float, decimal_places: int = 1) -> str:
@@ -47,45 +40,92 @@ def format_percentage(value: float, decimal_places: int = 1) -> str:
     return f"{value:.{decimal_places}f}%"
 
 
-def get_scenario_color(scenario_name: str) -> str:
+class _ScenarioClassification(NamedTuple):
+    """Name-derived attributes of a scenario."""
+    color: str
+    category: str
+    tax_status: str
+    housing_strategy: str
+    relocation_timing: str
+
+
+@functools.lru_cache(maxsize=1024)
+def _classify_scenario(scenario_name: str) -> _ScenarioClassification:
     """
-    Get color for a scenario based on its type and location.
-    
-    Args:
-        scenario_name: Name of the scenario
-    
-    Returns:
-        Hex color code
+    Derive every name-based attribute of a scenario in one go.
+
+    Memoized, so the substring checks run once per scenario name no matter
+    how many charts or tables ask for its color, category, etc.
     """
     # Color scheme based on scenario type
     if 'UK_Scenario' in scenario_name:
-        if 'A' in scenario_name:
-            return '#1f77b4'  # Blue for UK Scenario A
-        else:
-            return '#ff7f0e'  # Orange for UK Scenario B
-    
+        color = '#1f77b4' if 'A' in scenario_name else '#ff7f0e'  # Blue/Orange for UK Scenario A/B
     elif 'Seattle' in scenario_name:
         if 'Year4' in scenario_name:
-            return '#2ca02c' if 'UK_Home' in scenario_name else '#d62728'  # Green/Red
+            color = '#2ca02c' if 'UK_Home' in scenario_name else '#d62728'  # Green/Red
         else:
-            return '#9467bd' if 'UK_Home' in scenario_name else '#8c564b'  # Purple/Brown
-    
+            color = '#9467bd' if 'UK_Home' in scenario_name else '#8c564b'  # Purple/Brown
     elif 'New_York' in scenario_name:
         if 'Year4' in scenario_name:
-            return '#e377c2' if 'UK_Home' in scenario_name else '#7f7f7f'  # Pink/Gray
+            color = '#e377c2' if 'UK_Home' in scenario_name else '#7f7f7f'  # Pink/Gray
         else:
-            return '#bcbd22' if 'UK_Home' in scenario_name else '#17becf'  # Yellow/Cyan
-    
+            color = '#bcbd22' if 'UK_Home' in scenario_name else '#17becf'  # Yellow/Cyan
     elif 'Dubai' in scenario_name:
         if 'Year4' in scenario_name:
-            return '#ff9896' if 'UK_Home' in scenario_name else '#98df8a'  # Light Red/Green
+            color = '#ff9896' if 'UK_Home' in scenario_name else '#98df8a'  # Light Red/Green
         else:
-            return '#fdd0a2' if 'UK_Home' in scenario_name else '#c5b0d5'  # Light Orange/Purple
-    
+            color = '#fdd0a2' if 'UK_Home' in scenario_name else '#c5b0d5'  # Light Orange/Purple
     else:
-        return '#636363'  # Default gray
+        color = '#636363'  # Default gray
 
+    if 'UK_Scenario' in scenario_name:
+        category = 'UK'
+    elif 'Seattle' in scenario_name:
+        category = 'Seattle'
+    elif 'New_York' in scenario_name:
+        category = 'New York'
+    elif 'Dubai' in scenario_name:
+        category = 'Dubai'
+    else:
+        category = 'Other'
 
+    tax_status = 'Tax-Free' if 'Dubai' in scenario_name else 'Taxed'
+
+    if 'UK_Home' in scenario_name:
+        housing_strategy = 'UK Home'
+    elif 'Local_Home' in scenario_name:
+        housing_strategy = 'Local Home'
+    else:
+        housing_strategy = 'N/A'
+
+    if 'Year4' in scenario_name:
+        relocation_timing = 'Year 4 (3 UK years)'
+    elif 'Year5' in scenario_name:
+        relocation_timing = 'Year 5 (4 UK years)'
+    else:
+        relocation_timing = 'N/A'
+
+    return _ScenarioClassification(color, category, tax_status, housing_strategy, relocation_timing)
+
+def get_scenario_color(scenario_name: str) -> str:
+    """
+    Get color for a scenario based on its type and location.
+    
+    Args:
+        scenario_name: Name of the scenario
+    
+    Returns:
+        Hex color code
+    """
+    return _classify_scenario(scenario_name).color
+
+
+# Plotly hover templates; only the metric name varies
+_HOVER_TEMPLATE_GBP = '<b>%{{fullData.name}}</b><br>{metric}: £%{{y:,.0f}}<extra></extra>'
+_HOVER_TEMPLATE_OTHER = '<b>%{{fullData.name}}</b><br>{metric}: %{{y:,.0f}}<extra></extra>'
+
+
+@functools.lru_cache(maxsize=128)
 def create_hover_template(metric: str, currency: str = "GBP") -> str:
     """
     Create hover template for Plotly charts.
@@ -97,10 +137,7 @@ def create_hover_template(metric: str, currency: str = "GBP") -> str:
     Returns:
         Hover template string
     """
-    if currency == "GBP":
-        return f'<b>%{{fullData.name}}</b><br>{metric}: £%{{y:,.0f}}<extra></extra>'
-    else:
-        return f'<b>%{{fullData.name}}</b><br>{metric}: %{{y:,.0f}}<extra></extra>'
+    return (_HOVER_TEMPLATE_GBP if currency == "GBP" else _HOVER_TEMPLATE_OTHER).format(metric=metric)
 
 
 def calculate_percentage_change(initial: float, final: float) -> float:
@@ -138,6 +175,11 @@ def calculate_compound_growth_rate(initial: float, final: float, periods: int) -
     return growth_rate * 100
 
 
+# (threshold, suffix) pairs for format_large_number, largest first
+_NUMBER_SCALES = ((1_000_000_000, 'B'), (1_000_000, 'M'), (1_000, 'K'))
+
+
+@functools.lru_cache(maxsize=512)
 def format_large_number(value: float) -> str:
     """
     Format large numbers with K, M, B suffixes.
@@ -148,14 +190,10 @@ def format_large_number(value: float) -> str:
     Returns:
         Formatted string
     """
-    if value >= 1_000_000_000:
-        return f"{value / 1_000_000_000:.1f}B"
-    elif value >= 1_000_000:
-        return f"{value / 1_000_000:.1f}M"
-    elif value >= 1_000:
-        return f"{value / 1_000:.1f}K"
-    else:
-        return f"{value:,.0f}"
+    for divisor, suffix in _NUMBER_SCALES:
+        if value >= divisor:
+            return f"{value / divisor:.1f}{suffix}"
+    return f"{value:,.0f}"
 
 
 def get_scenario_category(scenario_name: str) -> str:
@@ -168,16 +206,7 @@ def get_scenario_category(scenario_name: str) -> str:
     Returns:
         Category string
     """
-    if 'UK_Scenario' in scenario_name:
-        return 'UK'
-    elif 'Seattle' in scenario_name:
-        return 'Seattle'
-    elif 'New_York' in scenario_name:
-        return 'New York'
-    elif 'Dubai' in scenario_name:
-        return 'Dubai'
-    else:
-        return 'Other'
+    return _classify_scenario(scenario_name).category
 
 
 def get_scenario_tax_status(scenario_name: str) -> str:
@@ -190,10 +219,7 @@ def get_scenario_tax_status(scenario_name: str) -> str:
     Returns:
         Tax status string
     """
-    if 'Dubai' in scenario_name:
-        return 'Tax-Free'
-    else:
-        return 'Taxed'
+    return _classify_scenario(scenario_name).tax_status
 
 
 def get_scenario_housing_strategy(scenario_name: str) -> str:
@@ -206,12 +232,7 @@ def get_scenario_housing_strategy(scenario_name: str) -> str:
     Returns:
         Housing strategy string
     """
-    if 'UK_Home' in scenario_name:
-        return 'UK Home'
-    elif 'Local_Home' in scenario_name:
-        return 'Local Home'
-    else:
-        return 'N/A'
+    return _classify_scenario(scenario_name).housing_strategy
 
 
 def get_scenario_relocation_timing(scenario_name: str) -> str:
@@ -224,12 +245,7 @@ def get_scenario_relocation_timing(scenario_name: str) -> str:
     Returns:
         Relocation timing string
     """
-    if 'Year4' in scenario_name:
-        return 'Year 4 (3 UK years)'
-    elif 'Year5' in scenario_name:
-        return 'Year 5 (4 UK years)'
-    else:
-        return 'N/A'
+    return _classify_scenario(scenario_name).relocation_timing
 
 
 def create_scenario_summary(scenario_name: str, metrics: Dict[str, Any]) -> Dict[str, Union[str, float]]:
@@ -243,12 +259,13 @@ def create_scenario_summary(scenario_name: str, metrics: Dict[str, Any]) -> Dict
     Returns:
         Summary dictionary
     """
+    classification = _classify_scenario(scenario_name)
     return {
         'name': scenario_name,
-        'category': get_scenario_category(scenario_name),
-        'tax_status': get_scenario_tax_status(scenario_name),
-        'housing_strategy': get_scenario_housing_strategy(scenario_name),
-        'relocation_timing': get_scenario_relocation_timing(scenario_name),
+        'category': classification.category,
+        'tax_status': classification.tax_status,
+        'housing_strategy': classification.housing_strategy,
+        'relocation_timing': classification.relocation_timing,
         'final_net_worth': metrics.get('final_net_worth', 0),
         'avg_annual_savings': metrics.get('avg_annual_savings', 0),
         'total_tax_burden': metrics.get('total_tax_burden', 0),
@@ -266,13 +283,7 @@ def validate_scenario_selection(selected_scenarios: List[str]) -> bool:
     Returns:
         True if selection is valid
     """
-    if not selected_scenarios:
-        return False
-    
-    if len(selected_scenarios) > 3:
-        return False
-    
-    return True
+    return 1 <= len(selected_scenarios) <= 3
 
 
 def get_scenario_comparison_insights(scenario1_metrics: Dict[str, Any], scenario2_metrics: Dict[str, Any]) -> List[str]:
@@ -325,18 +336,18 @@ def create_performance_ranking_table(rankings: Dict[str, List[Tuple[str, float]]
     Returns:
         Formatted table string
     """
-    table_rows: List[str] = []
-    
     # Net worth rankings
-    table_rows.append("<strong>Net Worth Rankings:</strong>")
-    for i, (scenario, value) in enumerate(rankings['net_worth'][:5], 1):
-        table_rows.append(f"{i}. {scenario}: {format_currency(value)}")
-    
-    table_rows.append("")  # Empty line
-    
-    # Savings rate rankings
-    table_rows.append("<strong>Savings Rate Rankings:</strong>")
-    for i, (scenario, value) in enumerate(rankings['savings_rate'][:5], 1):
-        table_rows.append(f"{i}. {scenario}: {format_percentage(value)}")
-    
-    return "\n".join(table_rows) 
\ No newline at end of file
+    table_rows: List[str] = ["<strong>Net Worth Rankings:</strong>"]
+    table_rows.extend(
+        f"{i}. {scenario}: {format_currency(value)}"
+        for i, (scenario, value) in enumerate(islice(rankings['net_worth'], 5), 1)
+    )
+    
+    # Empty line, then savings rate rankings
+    table_rows += ("", "<strong>Savings Rate Rankings:</strong>")
+    table_rows.extend(
+        f"{i}. {scenario}: {format_percentage(value)}"
+        for i, (scenario, value) in enumerate(islice(rankings['savings_rate'], 5), 1)
+    )
+    
+    return "\n".join(table_rows)
@@ -4,6 +4,10 @@ Contains core configuration parameters for the financial planning scenarios.
 Note: Many parameters have been moved to the new schema-driven architecture.
 """
 
+# UK house price growth (Savills forecast for 2025-2028); shared by every UK
+# purchase below. Growth paths are tuples so they can't be mutated in place.
+_UK_PRICE_GROWTH = (0.01, 0.04, 0.06, 0.06)
+
 CONFIG = {
     # Core Planning Parameters - Still used by financial_planner_pydantic.py
     "start_year": 2025,
@@ -93,7 +97,7 @@ CONFIG = {
     # Note: This is duplicated in scenarios but needed for UK-only scenarios
     "parental_home_purchase": {
         "target_year": 4,  # Purchase takes place at the start of Year 5
-        "price_grows": [0.01, 0.04, 0.06, 0.06],  # Savills forecast for 2025-2028
+        "price_grows": _UK_PRICE_GROWTH,  # Savills forecast for 2025-2028
         "base_price_2025": 600000,
         "deposit_pct": 0.20,
         "mortgage_rate": 0.0525,
@@ -135,7 +139,7 @@ CONFIG = {
                 "uk_home": {
                     "purchase_year": 5,
                     "price_gbp": 575000,
-                    "price_growth": [0.01, 0.04, 0.06, 0.06],
+                    "price_growth": _UK_PRICE_GROWTH,
                     "deposit_pct": 0.25,
                     "mortgage_rate": 0.0525,
                     "mortgage_term_years": 25
@@ -143,7 +147,7 @@ CONFIG = {
                 "local_home": {
                     "purchase_year": 3,
                     "price_usd": 750000,
-                    "price_growth": [0.03, 0.04, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05],
+                    "price_growth": (0.03, 0.04, 0.05, 0.05, 0.05, 0.05, 0.05, 0.05),
                     "deposit_pct": 0.25,
                     "mortgage_rate": 0.065,
                     "mortgage_term_years": 30
@@ -170,7 +174,7 @@ CONFIG = {
                 "uk_home": {
                     "purchase_year": 5,
                     "price_gbp": 575000,
-                    "price_growth": [0.01, 0.04, 0.06, 0.06],
+                    "price_growth": _UK_PRICE_GROWTH,
                     "deposit_pct": 0.20,
                     "mortgage_rate": 0.0525,
                     "mortgage_term_years": 25
@@ -178,7 +182,7 @@ CONFIG = {
                 "local_home": {
                     "purchase_year": 4,
                     "price_usd": 1200000,
-                    "price_growth": [0.04, 0.05, 0.06, 0.06, 0.06, 0.06, 0.06],
+                    "price_growth": (0.04, 0.05, 0.06, 0.06, 0.06, 0.06, 0.06),
                     "deposit_pct": 0.20,
                     "mortgage_rate": 0.065,
                     "mortgage_term_years": 30
@@ -205,7 +209,7 @@ CONFIG = {
                 "uk_home": {
                     "purchase_year": 5,
                     "price_gbp": 600000,
-                    "price_growth": [0.01, 0.04, 0.06, 0.06],
+                    "price_growth": _UK_PRICE_GROWTH,
                     "deposit_pct": 0.20,
                     "mortgage_rate": 0.0525,
                     "mortgage_term_years": 25
@@ -213,100 +217,37 @@ CONFIG = {
                 "local_home": {
                     "purchase_year": 3,
                     "price_usd": 520000,
-                    "price_growth": [0.02, 0.03, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04],
+                    "price_growth": (0.02, 0.03, 0.04, 0.04, 0.04, 0.04, 0.04, 0.04),
                     "deposit_pct": 0.20,
                     "mortgage_rate": 0.045,
                     "mortgage_term_years": 25
                 }
             }
         }
-    },
-    
-    # Delayed Relocation Scenarios - Still used by test_all_scenarios.py
-    "delayed_relocation": {
-        "seattle_year4_uk_home": {
-            "name": "Seattle (Move Year 4) - Buy UK Home",
-            "uk_years": 3,
-            "location": "seattle",
-            "salary_multiplier": 1.1,
-            "housing_strategy": "uk_home"
-        },
-        "seattle_year4_local_home": {
-            "name": "Seattle (Move Year 4) - Buy Local Home",
-            "uk_years": 3,
-            "location": "seattle",
-            "salary_multiplier": 1.1,
-            "housing_strategy": "local_home"
-        },
-        "seattle_year5_uk_home": {
-            "name": "Seattle (Move Year 5) - Buy UK Home",
-            "uk_years": 4,
-            "location": "seattle",
-            "salary_multiplier": 1.2,
-            "housing_strategy": "uk_home"
-        },
-        "seattle_year5_local_home": {
-            "name": "Seattle (Move Year 5) - Buy Local Home",
-            "uk_years": 4,
-            "location": "seattle",
-            "salary_multiplier": 1.2,
-            "housing_strategy": "local_home"
-        },
-        "new_york_year4_uk_home": {
-            "name": "New York (Move Year 4) - Buy UK Home",
-            "uk_years": 3,
-            "location": "new_york",
-            "salary_multiplier": 1.1,
-            "housing_strategy": "uk_home"
-        },
-        "new_york_year4_local_home": {
-            "name": "New York (Move Year 4) - Buy Local Home",
-            "uk_years": 3,
-            "location": "new_york",
-            "salary_multiplier": 1.1,
-            "housing_strategy": "local_home"
-        },
-        "new_york_year5_uk_home": {
-            "name": "New York (Move Year 5) - Buy UK Home",
-            "uk_years": 4,
-            "location": "new_york",
-            "salary_multiplier": 1.2,
-            "housing_strategy": "uk_home"
-        },
-        "new_york_year5_local_home": {
-            "name": "New York (Move Year 5) - Buy Local Home",
-            "uk_years": 4,
-            "location": "new_york",
-            "salary_multiplier": 1.2,
-            "housing_strategy": "local_home"
-        },
-        "dubai_year4_uk_home": {
-            "name": "Dubai (Move Year 4) - Buy UK Home",
-            "uk_years": 3,
-            "location": "dubai",
-            "salary_multiplier": 1.1,
-            "housing_strategy": "uk_home"
-        },
-        "dubai_year4_local_home": {
-            "name": "Dubai (Move Year 4) - Buy Local Home",
-            "uk_years": 3,
-            "location": "dubai",
-            "salary_multiplier": 1.1,
-            "housing_strategy": "local_home"
-        },
-        "dubai_year5_uk_home": {
-            "name": "Dubai (Move Year 5) - Buy UK Home",
-            "uk_years": 4,
-            "location": "dubai",
-            "salary_multiplier": 1.2,
-            "housing_strategy": "uk_home"
-        },
-        "dubai_year5_local_home": {
-            "name": "Dubai (Move Year 5) - Buy Local Home",
-            "uk_years": 4,
-            "location": "dubai",
-            "salary_multiplier": 1.2,
-            "housing_strategy": "local_home"
-        }
     }
-} 
\ No newline at end of file
+}
+
+# Delayed Relocation Scenarios - Still used by test_all_scenarios.py
+# Every location is offered with a move in year 4 or 5 and either housing strategy
+_DELAYED_LOCATIONS = (("seattle", "Seattle"), ("new_york", "New York"), ("dubai", "Dubai"))
+_DELAYED_MOVES = ((4, 3, 1.1), (5, 4, 1.2))  # (move year, UK years, salary multiplier)
+_DELAYED_HOUSING = (("uk_home", "UK Home"), ("local_home", "Local Home"))
+
+
+def _expand_delayed_relocation() -> dict:
+    """Build the delayed relocation scenarios from location x move year x housing."""
+    scenarios = {}
+    for location, location_name in _DELAYED_LOCATIONS:
+        for move_year, uk_years, salary_multiplier in _DELAYED_MOVES:
+            for strategy, strategy_name in _DELAYED_HOUSING:
+                scenarios[f"{location}_year{move_year}_{strategy}"] = {
+                    "name": f"{location_name} (Move Year {move_year}) - Buy {strategy_name}",
+                    "uk_years": uk_years,
+                    "location": location,
+                    "salary_multiplier": salary_multiplier,
+                    "housing_strategy": strategy
+                }
+    return scenarios
+
+
+CONFIG["delayed_relocation"] = _expand_delayed_relocation()
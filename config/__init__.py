@@ -1,21 +1,70 @@
 """
 Configuration Package
 Contains YAML-based configuration system and re-exports legacy CONFIG.
+
+The legacy CONFIG is loaded on first access, so importing the YAML-based
+modules (e.g. ``config.template_engine``) does not execute the root config.py.
 """
 
 import os
+import sys
 import importlib.util
 
+from . import disk_cache
+
 # Import the legacy CONFIG from the root config.py to maintain compatibility
 parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 config_path = os.path.join(parent_dir, 'config.py')
 
-# Load the config module dynamically
-spec = importlib.util.spec_from_file_location("legacy_config", config_path)
-legacy_config = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(legacy_config)
+# The root config.py is shadowed by this package, so it is registered in
+# sys.modules under its own name; it is executed at most once per process.
+_LEGACY_MODULE_NAME = "legacy_config"
+
+# On-disk copy of the evaluated CONFIG, invalidated when config.py changes
+_CONFIG_CACHE_DIR = disk_cache.CACHE_ROOT / "config"
+
+
+def _evaluate_legacy_config() -> dict:
+    """Evaluate the root config.py, going through the on-disk cache when possible."""
+    source_fingerprint = disk_cache.fingerprint([config_path])
+    config = disk_cache.load(_CONFIG_CACHE_DIR, _LEGACY_MODULE_NAME, source_fingerprint)
+    if config is not disk_cache.MISS:
+        return config
+
+    spec = importlib.util.spec_from_file_location(_LEGACY_MODULE_NAME, config_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    config = module.CONFIG
+
+    disk_cache.store(_CONFIG_CACHE_DIR, _LEGACY_MODULE_NAME, source_fingerprint, config)
+    return config
+
+
+def _load_legacy_config() -> dict:
+    """Load the legacy CONFIG (once per process) and return it."""
+    legacy_config = sys.modules.get(_LEGACY_MODULE_NAME)
+    if legacy_config is None:
+        legacy_config = type(sys)(_LEGACY_MODULE_NAME)
+        legacy_config.__file__ = config_path
+        legacy_config.CONFIG = _evaluate_legacy_config()
+        sys.modules[_LEGACY_MODULE_NAME] = legacy_config
+    return legacy_config.CONFIG
+
+
+def _get_config() -> dict:
+    """Return the legacy CONFIG, loading it on first use."""
+    config = globals().get('CONFIG')
+    if config is None:
+        config = _load_legacy_config()
+        globals()['CONFIG'] = config
+    return config
+
+
+def __getattr__(name):
+    # Re-export CONFIG for backward compatibility, loading it on first use
+    if name == 'CONFIG':
+        return _get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Re-export CONFIG for backward compatibility
-CONFIG = legacy_config.CONFIG
 
-__all__ = ['CONFIG'] 
\ No newline at end of file
+__all__ = ['CONFIG']
@@ -0,0 +1,108 @@
+"""
+On-disk pickle caches shared by the configuration and analysis code.
+
+Every cache follows the same rule: an entry is stored with the fingerprint of
+its inputs and is only returned while that fingerprint still matches. A
+fingerprint is a blake2b hash over the paths and contents of the input files
+(plus any extra key parts), so editing any input invalidates the entry.
+Content digests are memoized per process against each file's (mtime_ns, size),
+so checking a warm entry only stats its inputs.
+
+Entries live at ``<directory>/<key>.pkl``. Writes are best effort (a
+per-process temp file renamed into place) and any read error is a miss.
+"""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Root directory of every on-disk cache (ignored by git)
+CACHE_ROOT = PROJECT_ROOT / ".cache"
+
+# Source code that calculated results depend on: these packages plus the
+# top-level modules they import
+_SOURCE_PACKAGES = ('config', 'models', 'utils')
+_SOURCE_MODULES = ('config.py', 'constants.py')
+
+# Returned by load() when there is no usable entry
+MISS = object()
+
+# Content digests: path -> (mtime_ns, size, digest)
+_FILE_DIGESTS: Dict[str, Tuple[int, int, bytes]] = {}
+
+
+def file_digest(path: PathLike) -> bytes:
+    """Content hash of a file, recomputed only when its (mtime, size) changes."""
+    path_key = os.fspath(path)
+    stat = os.stat(path_key)
+    entry = _FILE_DIGESTS.get(path_key)
+    if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+        return entry[2]
+    with open(path_key, 'rb') as f:
+        digest = hashlib.blake2b(f.read(), digest_size=16).digest()
+    _FILE_DIGESTS[path_key] = (stat.st_mtime_ns, stat.st_size, digest)
+    return digest
+
+
+def fingerprint(paths: Iterable[PathLike], *extra: str) -> str:
+    """Hash of the given files' paths and contents, plus any extra key parts."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in extra:
+        digest.update(part.encode())
+        digest.update(b'\0')
+    for path in paths:
+        digest.update(os.fspath(path).encode())
+        digest.update(b'\0')
+        digest.update(file_digest(path))
+    return digest.hexdigest()
+
+
+def source_files() -> List[Path]:
+    """Python sources of the calculation path, in a stable order."""
+    files = [PROJECT_ROOT / name for name in _SOURCE_MODULES if (PROJECT_ROOT / name).is_file()]
+    for package in _SOURCE_PACKAGES:
+        files.extend(sorted((PROJECT_ROOT / package).rglob('*.py')))
+    return files
+
+
+def entry_path(directory: PathLike, key: str) -> Path:
+    """File holding the entry for ``key``."""
+    return Path(directory) / f"{key.replace('/', '__')}.pkl"
+
+
+def load(directory: PathLike, key: str, expected_fingerprint: str) -> Any:
+    """Cached value for ``key`` if it was stored with ``expected_fingerprint``, else MISS."""
+    try:
+        with open(entry_path(directory, key), 'rb') as f:
+            # The fingerprint is pickled first, so stale entries are never unpickled
+            if pickle.load(f) != expected_fingerprint:
+                return MISS
+            return pickle.load(f)
+    except (OSError, ValueError, TypeError, AttributeError, ImportError, EOFError, pickle.UnpicklingError):
+        return MISS
+
+
+def write(directory: PathLike, key: str, value_fingerprint: str, value: Any) -> None:
+    """Store ``value`` for ``key``, replacing any older entry; raises OSError or PicklingError on failure."""
+    path = entry_path(directory, key)
+    temp_file = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(temp_file, 'wb') as f:
+        pickle.dump(value_fingerprint, f, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_file, path)
+
+
+def store(directory: PathLike, key: str, value_fingerprint: str, value: Any) -> bool:
+    """Best-effort write(); returns False if the entry could not be written."""
+    try:
+        write(directory, key, value_fingerprint, value)
+    except (OSError, pickle.PicklingError):
+        return False
+    return True
@@ -13,44 +13,269 @@ Key Features:
 - NO FALLBACK LOGIC - Fails fast when configuration is missing
 """
 
+import hashlib
+import logging
 import os
 import yaml
 import sys
+import threading
+from collections import OrderedDict
+from itertools import groupby
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Union
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, List, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 import copy
 
-# Import unified models
+import numpy as np
+
+# Import unified models (required: module-level tables below use the enums)
 sys.path.append(str(Path(__file__).parent.parent))  # Add parent directory to path
+from models.unified_financial_data import (
+    UnifiedFinancialScenario,
+    Currency, Jurisdiction, FinancialPhase,
+    PhaseConfig, ResolvedScenarioConfig
+)
+from config import disk_cache
+
+logger = logging.getLogger(__name__)
+
+# Prefer the libyaml-backed loader; fall back to the pure-Python one
 try:
-    from models.unified_financial_data import (
-        UnifiedFinancialScenario, UnifiedFinancialData,
-        Currency, Jurisdiction, FinancialPhase,
-        PhaseConfig, ResolvedScenarioConfig
-    )
-    from models.unified_helpers import (
-        create_unified_income_breakdown,
-        create_unified_expense_breakdown,
-        create_unified_tax_breakdown,
-        create_unified_investment_breakdown,
-        create_unified_net_worth_breakdown,
-    )
+    from yaml import CSafeLoader as SafeLoader
 except ImportError:
-    # Fallback for testing
-    UnifiedFinancialScenario = None
-    UnifiedFinancialData = None
-    PhaseConfig = None
-    ResolvedScenarioConfig = None
+    from yaml import SafeLoader
 
 # Import tax system if available
 try:
-    from utils.tax.tax_utils import calculate_yaml_tax_for_location
+    from utils.tax.tax_utils import calculate_yaml_tax_for_location_vec
     TAX_SUPPORT = True
 except ImportError:
     TAX_SUPPORT = False
 
+# Numba is optional: without it the phase state kernel runs as plain Python
+try:
+    from numba import njit
+    NUMBA_SUPPORT = True
+except ImportError:
+    NUMBA_SUPPORT = False
+
+
+# Parsed YAML cache shared by all engines: absolute path -> (mtime, size, data)
+_YAML_CACHE_MAXSIZE = 100
+_YAML_CACHE: "OrderedDict[str, Tuple[float, int, Any]]" = OrderedDict()
+_YAML_CACHE_LOCK = threading.Lock()
+
+# Second tier on disk, so fresh processes (CLI runs, pool workers) skip re-parsing.
+# Pickle rather than JSON because templates use integer mapping keys.
+_YAML_DISK_CACHE_DIR = disk_cache.CACHE_ROOT / "yaml"
+
+# Fully resolved scenario configs, invalidated by any change to the inputs
+# load_scenario reads (see TemplateEngine._scenario_fingerprint)
+_SCENARIO_DISK_CACHE_DIR = disk_cache.CACHE_ROOT / "resolved_scenarios"
+
+# Declarative validation rules for resolved scenarios (see _validate_resolved_config)
+_REQUIRED_PLANNING_FIELDS = ('start_year', 'duration_years', 'start_age')
+# (error message, check) pairs applied to every PhaseConfig, in reporting order
+_PHASE_RULES = (
+    ('missing salary_progression', lambda phase: phase.salary_progression),
+    ('missing valid tax_system', lambda phase: phase.tax_system and 'tax_system_id' in phase.tax_system),
+    ('missing housing_strategy', lambda phase: phase.housing_strategy),
+    ('missing expense_profile', lambda phase: phase.expense_profile),
+)
+# Salary progression type -> fields its 'progression' section must define
+_PROGRESSION_REQUIRED_FIELDS = {
+    'explicit_array': ('salary_by_year',),
+    'percentage_growth': ('base_salary', 'growth_by_year'),
+}
+
+# Placeholder exchange rates applied to every location and year. Shared by
+# reference (the models copy it on validation), so it is exposed read-only.
+_DEFAULT_EXCHANGE_RATES: Mapping[Currency, float] = MappingProxyType(
+    {Currency.GBP: 1.0, Currency.USD: 1.26, Currency.EUR: 1.15}
+)
+
+# Immutable YAML leaf types; these never need copying when merged
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _copy_leaf(value: Any) -> Any:
+    """Copy a merged template value, skipping deepcopy for scalars and lists of scalars."""
+    if isinstance(value, _SCALAR_TYPES):
+        return value
+    if isinstance(value, list) and all(isinstance(item, _SCALAR_TYPES) for item in value):
+        return value[:]
+    return copy.deepcopy(value)
+
+
+def _parse_yaml_file(path_key: str) -> Any:
+    """Parse a YAML file, going through the on-disk parse cache when possible."""
+    cache_key = hashlib.blake2b(path_key.encode(), digest_size=16).hexdigest()
+    source_fingerprint = disk_cache.fingerprint([path_key])
+    data = disk_cache.load(_YAML_DISK_CACHE_DIR, cache_key, source_fingerprint)
+    if data is not disk_cache.MISS:
+        return data
+
+    with open(path_key, 'r', encoding='utf-8') as f:
+        data = yaml.load(f, Loader=SafeLoader)
+
+    disk_cache.store(_YAML_DISK_CACHE_DIR, cache_key, source_fingerprint, data)
+    return data
+
+
+def _load_yaml_cached(file_path: Path) -> Any:
+    """
+    Parse a YAML file, reusing the previous parse while the file is unchanged.
+
+    In-memory entries are validated against the file's (mtime, size) and the
+    on-disk tier against its contents, so edits are picked up on the next
+    load. A deep copy is returned because callers merge into and mutate the
+    loaded templates.
+    """
+    path_key = str(Path(file_path).resolve())
+    stat = os.stat(path_key)
+    signature = (stat.st_mtime, stat.st_size)
+
+    with _YAML_CACHE_LOCK:
+        entry = _YAML_CACHE.get(path_key)
+        if entry is not None and entry[:2] == signature:
+            _YAML_CACHE.move_to_end(path_key)
+            return copy.deepcopy(entry[2])
+
+    data = _parse_yaml_file(path_key)
+
+    with _YAML_CACHE_LOCK:
+        _YAML_CACHE[path_key] = (signature[0], signature[1], data)
+        _YAML_CACHE.move_to_end(path_key)
+        while len(_YAML_CACHE) > _YAML_CACHE_MAXSIZE:
+            _YAML_CACHE.popitem(last=False)
+
+    return copy.deepcopy(data)
+
+
+def clear_yaml_cache() -> None:
+    """Drop all cached YAML parses."""
+    with _YAML_CACHE_LOCK:
+        _YAML_CACHE.clear()
+
+
+# Year-keyed template maps precompiled into per-year tables, stored under
+# '_compiled' beside the map; the value says how keys are matched
+_YEAR_MAP_KEYS = {
+    'growth_by_year': 'rate',        # GenericCalculationEngine._get_rate semantics
+    'rates_by_year': 'rate',
+    'adjustments_by_year': 'range',  # GenericCalculationEngine._in_range semantics
+}
+
+
+def _rate_key_matches(key: Any, year: int) -> bool:
+    """Whether a rates-dict key ("1-3", "4+" or an exact int) covers ``year``."""
+    if isinstance(key, str):
+        if '-' in key:
+            start, end = map(int, key.split('-'))
+            return start <= year <= end
+        return key.endswith('+') and year >= int(key[:-1])
+    return key == year
+
+
+def _range_matches(range_str: str, year: int) -> bool:
+    """Whether a range string ("1-3", "4+" or "5") covers ``year``."""
+    if '+' in range_str: return year >= int(range_str.replace('+', ''))
+    if '-' in range_str:
+        start, end = map(int, range_str.split('-'))
+        return start <= year <= end
+    return year == int(range_str)
+
+
+def _year_key_bound(key: Any) -> int:
+    """Largest year a key can single out; every later year matches the same keys."""
+    if isinstance(key, bool) or not isinstance(key, (str, int)):
+        raise TypeError(f"Unsupported year key: {key!r}")
+    if isinstance(key, int):
+        return key
+    return max(int(part) for part in key.replace('+', '').split('-'))
+
+
+def _compile_year_map(mapping: Dict, kind: str) -> Optional[Tuple]:
+    """
+    Flatten a year-keyed map into a tuple indexed by ``year - 1``.
+
+    Entry i is the first matching value for year i + 1 (None if no key
+    matches); the last entry also covers every later year. Returns None when
+    the map can't be compiled (unknown key formats or null values), in which
+    case lookups keep parsing the keys.
+    """
+    matches = _rate_key_matches if kind == 'rate' else _range_matches
+    try:
+        if any(value is None for value in mapping.values()):
+            return None
+        bound = max((_year_key_bound(key) for key in mapping), default=0)
+        return tuple(
+            next((value for key, value in mapping.items() if matches(key, year)), None)
+            for year in range(1, bound + 2)
+        )
+    except (TypeError, ValueError):
+        return None
+
+
+def _compile_year_maps(template: Dict) -> None:
+    """Attach compiled tables for every year-keyed map in a resolved template (in place)."""
+    stack = [template]
+    while stack:
+        section = stack.pop()
+        compiled = {}
+        for key, value in section.items():
+            if not isinstance(value, dict) or key == '_compiled':
+                continue
+            if key in _YEAR_MAP_KEYS:
+                table = _compile_year_map(value, _YEAR_MAP_KEYS[key])
+                if table is not None:
+                    compiled[key] = table
+            else:
+                stack.append(value)
+        # Replaces any tables inherited from a parent template
+        section.pop('_compiled', None)
+        if compiled:
+            section['_compiled'] = compiled
+
+
+def _jurisdiction_for_location(location_market: str) -> Jurisdiction:
+    """Tax jurisdiction implied by a location market id."""
+    if location_market.startswith('us_'):
+        return Jurisdiction.US
+    elif location_market.startswith('uae_'):
+        return Jurisdiction.UAE
+    else:
+        return Jurisdiction.UK
+
+
+def _currency_for_location(location_market: str) -> Currency:
+    """Primary currency implied by a location market id."""
+    if location_market.startswith('us_') or location_market.startswith('uae_'):
+        return Currency.USD
+    else:
+        return Currency.GBP
+
+
+def _overall_phase_for(phases: List[PhaseConfig]) -> FinancialPhase:
+    """Overall phase enum implied by a scenario's phase structure."""
+    if len(phases) == 1:
+        location = phases[0].location_market
+        if location.startswith('us_') or location.startswith('uae_'):
+            return FinancialPhase.INTERNATIONAL_ONLY
+        else:
+            return FinancialPhase.UK_ONLY
+    else:
+        # Multi-phase - check if it goes UK -> International
+        first_location = phases[0].location_market
+        has_international = any(p.location_market.startswith(('us_', 'uae_')) for p in phases)
+
+        if first_location == 'uk' and has_international:
+            return FinancialPhase.UK_TO_INTERNATIONAL
+        else:
+            return FinancialPhase.INTERNATIONAL_ONLY
+
 
 class TemplateType(Enum):
     """Supported template types."""
@@ -70,15 +295,62 @@ class TemplateType(Enum):
 class TemplateEngine:
     """Core engine for loading and resolving YAML templates."""
 
-    def __init__(self, config_root: str = "config"):
-        """Initialize template engine with config directory."""
+    def __init__(self, config_root: str = "config", persistent_cache: bool = False):
+        """
+        Initialize template engine with config directory.
+
+        With persistent_cache, resolved scenarios are also kept on disk (see
+        load_scenario); it is off by default so the app and tests never read
+        or write the shared .cache directory.
+        """
         self.config_root = Path(config_root)
         self.template_cache = {}
         self.validation_enabled = True
+        self.persistent_cache = persistent_cache
+        self._shared_fingerprint: Optional[str] = None
 
     def load_scenario(self, scenario_id: str) -> ResolvedScenarioConfig:
-        """Always return normalized multi-phase structure."""
+        """
+        Always return normalized multi-phase structure.
+
+        With persistent_cache, a fresh process reuses the resolved config
+        pickled by an earlier load as long as none of its input files changed,
+        skipping YAML parsing and template resolution. Only validated configs
+        are stored.
+        """
         scenario_path = self.config_root / "scenarios" / f"{scenario_id}.yaml"
+        if not self.persistent_cache or not scenario_path.exists():
+            return self._resolve_scenario(scenario_id, scenario_path)
+
+        source_fingerprint = self._scenario_fingerprint(scenario_path)
+        config = disk_cache.load(_SCENARIO_DISK_CACHE_DIR, scenario_id, source_fingerprint)
+        if config is not disk_cache.MISS:
+            return config
+
+        config = self._resolve_scenario(scenario_id, scenario_path)
+        if self.validation_enabled:
+            disk_cache.store(_SCENARIO_DISK_CACHE_DIR, scenario_id, source_fingerprint, config)
+        return config
+
+    def _scenario_fingerprint(self, scenario_path: Path) -> str:
+        """
+        Fingerprint of everything a resolved scenario is built from.
+
+        Covers the config root, the scenario file, every template and tax
+        system YAML under the config root, and the project's Python sources.
+        The part shared by all scenarios is computed once per engine, which
+        already keeps resolved templates for its whole lifetime; a new engine
+        picks up later edits.
+        """
+        if self._shared_fingerprint is None:
+            dependencies = sorted((self.config_root / "templates").rglob("*.yaml"))
+            dependencies += sorted((self.config_root / "tax_systems").rglob("*.yaml"))
+            dependencies += disk_cache.source_files()
+            self._shared_fingerprint = disk_cache.fingerprint(dependencies, str(self.config_root.resolve()))
+        return disk_cache.fingerprint([scenario_path], self._shared_fingerprint)
+
+    def _resolve_scenario(self, scenario_id: str, scenario_path: Path) -> ResolvedScenarioConfig:
+        """Build and validate the resolved config for a scenario from its YAML."""
         scenario_data = self._load_yaml_file(scenario_path)
 
         if not scenario_data:
@@ -114,7 +386,8 @@ class TemplateEngine:
             scenario_metadata=scenario_data.get('scenario', {}),
             planning=normalized_planning,
             phases=phases,  # Always a list, even for single-phase
-            is_multi_phase=len(phases) > 1  # Just for metadata/debugging
+            is_multi_phase=len(phases) > 1,  # Just for metadata/debugging
+            phase_enum=_overall_phase_for(phases)
         )
 
         # Validate resolved configuration
@@ -134,17 +407,20 @@ class TemplateEngine:
         # Get duration from planning or fallback
         duration = planning.get('duration_years', 10)
 
+        location_market = composition.get('location_market', 'uk')
         return PhaseConfig(
             name="main_phase",
             duration=duration,
             start_year=1,
             end_year=duration,
-            location_market=composition.get('location_market', 'uk'),
+            location_market=location_market,
             salary_progression=salary_progression,
             expense_profile=composition.get('expense_profile', 'graduate'),
             housing_strategy=housing_strategy,
             tax_system=tax_system,
             investment_strategy=investment_strategy,
+            jurisdiction=_jurisdiction_for_location(location_market),
+            currency=_currency_for_location(location_market),
         )
 
     def _load_phases_from_yaml(self, phases_config: Dict) -> List[PhaseConfig]:
@@ -182,6 +458,8 @@ class TemplateEngine:
                 housing_strategy=housing_strategy,
                 tax_system=tax_system,
                 investment_strategy=investment_strategy,
+                jurisdiction=_jurisdiction_for_location(location_market),
+                currency=_currency_for_location(location_market),
             )
 
             phases.append(phase)
@@ -212,37 +490,49 @@ class TemplateEngine:
             template_name = template_spec
             composition_overrides = {}
 
-        # Check cache first
+        template_data = self._resolve_template(template_type, template_name)
+
+        # Apply composition overrides if any (merging already copies the base)
+        if composition_overrides:
+            template_data = self._merge_templates(template_data, composition_overrides)
+            _compile_year_maps(template_data)
+            return template_data
+        return copy.deepcopy(template_data)
+
+    def _resolve_template(self, template_type: str, template_name: str) -> Dict[str, Any]:
+        """
+        Return the resolved (inheritance applied) template, memoized per type and name.
+
+        The cached dict itself is returned, so callers must not mutate it;
+        _load_template hands out copies.
+        """
         cache_key = f"{template_type}/{template_name}"
-        if cache_key in self.template_cache:
-            base_template = copy.deepcopy(self.template_cache[cache_key])
-            template_data = base_template
+        template_data = self.template_cache.get(cache_key)
+        if template_data is not None:
+            return template_data
+
+        # Load from file (the parse cache returns a copy we own)
+        template_path = self.config_root / "templates" / template_type / f"{template_name}.yaml"
+        logger.debug("Loading template from %s", template_path)
+        if template_path.exists():
+            template_data = _load_yaml_cached(template_path)
         else:
-            # Load from file
-            template_path = self.config_root / "templates" / template_type / f"{template_name}.yaml"
-            print(f"Loading template from {template_path}")
-            if template_path.exists():
-                with open(template_path, 'r', encoding='utf-8') as f:
-                    template_data = yaml.safe_load(f)
-            else:
-                raise ValueError(f"Template {template_name} not found at {template_path}")
+            raise ValueError(f"Template {template_name} not found at {template_path}")
 
-        # Handle template inheritance
+        # Handle template inheritance; merging copies the base, so a plain
+        # parent name can be merged straight from the cache
         if 'extends' in template_data:
-            base_template = self._load_template(template_type, template_data['extends'])
+            extends = template_data['extends']
+            if isinstance(extends, str):
+                base_template = self._resolve_template(template_type, extends)
+            else:
+                base_template = self._load_template(template_type, extends)
             template_data = self._merge_templates(base_template, template_data)
 
-        # Cache the resolved template
-        self.template_cache[cache_key] = copy.deepcopy(template_data)
-        base_template = copy.deepcopy(template_data)
-
-        # Apply composition overrides if any
-        if composition_overrides:
-            final_template = self._merge_templates(base_template, composition_overrides)
-        else:
-            final_template = base_template
-
-        return final_template
+        # Parse year ranges once here rather than on every per-year lookup
+        _compile_year_maps(template_data)
+        self.template_cache[cache_key] = template_data
+        return template_data
 
     def _load_tax_system(self, tax_system_name: str) -> Dict[str, Any]:
         """Load tax system configuration - tax_system_name is required."""
@@ -268,9 +558,9 @@ class TemplateEngine:
             if 'template' in event_config:
                 # Load the life event template
                 template_name = event_config['template']
-                event_template = self._load_template('life_events', template_name)
+                event_template = self._resolve_template('life_events', template_name)
 
-                # Merge event-specific overrides
+                # Merge event-specific overrides (copies the shared template)
                 merged_event = self._merge_templates(event_template, event_config)
                 resolved_events.append(merged_event)
             else:
@@ -285,37 +575,43 @@ class TemplateEngine:
             if not file_path.exists():
                 return None
 
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+            return _load_yaml_cached(file_path)
         except Exception as e:
             raise ValueError(f"Error loading YAML file {file_path}: {e}")
 
     def _merge_templates(self, base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-        """Deep merge two template dictionaries with advanced inheritance support."""
+        """
+        Deep merge two template dictionaries with advanced inheritance support.
+
+        At every level an 'overrides' section is applied before the remaining
+        keys and 'extends' is skipped. Merges into a single deep copy of base,
+        walking nested dicts with an explicit stack (in the same order a
+        recursive merge would); override values are copied as they are assigned,
+        scalars and lists of scalars without going through deepcopy.
+        """
         result = copy.deepcopy(base)
+        stack = [(result, override)]
 
-        # Handle special 'overrides' section for clean inheritance
-        if 'overrides' in override:
-            overrides_section = override['overrides']
-            for key, value in overrides_section.items():
-                if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                    result[key] = self._merge_templates(result[key], value)
-                else:
-                    result[key] = copy.deepcopy(value)
-
-            # Remove the overrides section after applying
-            override_copy = copy.deepcopy(override)
-            del override_copy['overrides']
-            override = override_copy
-
-        # Standard deep merge for other sections
-        for key, value in override.items():
-            if key == 'extends':
-                continue  # Skip extends keyword
-            elif key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._merge_templates(result[key], value)
+        while stack:
+            target, source = stack.pop()
+
+            # Handle special 'overrides' section for clean inheritance
+            if 'overrides' in source:
+                items = list(source['overrides'].items())
+                items.extend((key, value) for key, value in source.items() if key not in ('overrides', 'extends'))
             else:
-                result[key] = copy.deepcopy(value)
+                items = [(key, value) for key, value in source.items() if key != 'extends']
+
+            nested = []
+            for key, value in items:
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    nested.append((current, value))
+                else:
+                    target[key] = _copy_leaf(value)
+
+            # Reversed so nested merges are popped in key order
+            stack.extend(reversed(nested))
 
         return result
 
@@ -345,15 +641,9 @@ class TemplateEngine:
 
     def _validate_planning_section(self, planning: Dict) -> List[str]:
         """Validate planning section."""
-        errors = []
-
         # Required planning fields
-        required_fields = ['start_year', 'duration_years', 'start_age']
-        for field in required_fields:
-            if field not in planning:
-                errors.append(f"Planning missing required '{field}'")
-
-        return errors
+        return [f"Planning missing required '{field}'"
+                for field in _REQUIRED_PLANNING_FIELDS if field not in planning]
 
     def _validate_phases(self, phases: List[PhaseConfig], planning: Dict) -> List[str]:
         """Validate phases - works for single or multiple phases."""
@@ -378,37 +668,96 @@ class TemplateEngine:
 
     def _validate_single_phase(self, phase: PhaseConfig, phase_index: int) -> List[str]:
         """Shared validation logic for each phase."""
-        errors = []
-
         # Same validation logic used for both single-phase and multi-phase
-        if not phase.salary_progression:
-            errors.append(f"Phase {phase_index} missing salary_progression")
+        errors = [f"Phase {phase_index} {message}" for message, check in _PHASE_RULES if not check(phase)]
 
-        if not phase.tax_system or 'tax_system_id' not in phase.tax_system:
-            errors.append(f"Phase {phase_index} missing valid tax_system")
-
-        if not phase.housing_strategy:
-            errors.append(f"Phase {phase_index} missing housing_strategy")
-
-        if not phase.expense_profile:
-            errors.append(f"Phase {phase_index} missing expense_profile")
-
-        # Validate salary progression structure
+        # Validate salary progression structure against the rules for its type
         if phase.salary_progression:
             prog = phase.salary_progression.get('progression')
             if prog:
-                if prog.get('type') == 'explicit_array':
-                    if 'salary_by_year' not in prog:
-                        errors.append(f"Phase {phase_index} explicit array progression missing salary_by_year")
-                elif prog.get('type') == 'percentage_growth':
-                    if 'base_salary' not in prog:
-                        errors.append(f"Phase {phase_index} percentage growth progression missing base_salary")
-                    if 'growth_by_year' not in prog:
-                        errors.append(f"Phase {phase_index} percentage growth progression missing growth_by_year")
+                progression_type = prog.get('type')
+                required = _PROGRESSION_REQUIRED_FIELDS.get(progression_type, ()) if isinstance(progression_type, str) else ()
+                errors.extend(
+                    f"Phase {phase_index} {progression_type.replace('_', ' ')} progression missing {field}"
+                    for field in required if field not in prog
+                )
 
         return errors
 
 
+# Annual growth factor applied to invested savings
+_INVESTMENT_GROWTH_FACTOR = 1.065
+# Annual interest rate used to split a mortgage payment into interest and principal
+_MORTGAGE_AMORTIZATION_RATE = 0.05
+
+
+def _phase_state_kernel(years, disposable_income, rent_cost, buys, purchase_year, price, deposit_pct,
+                        fees_pct, mortgage_rate, mortgage_term_years, investments, equity, balance, owned):
+    """
+    Housing cost and savings state over a run of plan years.
+
+    This is the only implementation of the housing and state rules: rent
+    unless the strategy buys, deposit plus fees in the purchase year, then
+    annuity mortgage payments while a balance remains. Savings that are left
+    over grow the investments, and each payment repays principal on top of
+    interest. ``disposable_income`` is net income less living expenses. Returns
+    (housing_cost, investments_start, equity_start, investments, equity,
+    balance, owned), where the *_start arrays hold the state at the start of
+    each year and the scalars are the state after the last one. Written as an
+    explicit loop so it compiles under Numba; fastmath is deliberately off so
+    results match the interpreted loop exactly.
+    """
+    n = years.shape[0]
+    housing_cost = np.empty(n, dtype=np.float64)
+    investments_start = np.empty(n, dtype=np.float64)
+    equity_start = np.empty(n, dtype=np.float64)
+    monthly_rate = mortgage_rate / 12
+    num_payments = mortgage_term_years * 12
+
+    for i in range(n):
+        year = years[i]
+        investments_start[i] = investments
+        equity_start[i] = equity
+
+        purchased = False
+        deposit = 0.0
+        if buys and year == purchase_year and not owned:
+            deposit = price * deposit_pct
+            cost = deposit + price * fees_pct
+            purchased = True
+        elif buys and year > purchase_year and owned and balance > 0:
+            if monthly_rate == 0:
+                monthly = balance / num_payments
+            else:
+                monthly = balance * (monthly_rate * (1 + monthly_rate)**num_payments) / ((1 + monthly_rate)**num_payments - 1)
+            cost = monthly * 12
+        else:
+            cost = rent_cost
+        housing_cost[i] = cost
+
+        savings = disposable_income[i] - cost
+        if savings < 0:
+            savings = 0.0
+        investments = investments * _INVESTMENT_GROWTH_FACTOR + savings
+
+        if purchased:
+            owned = True
+            equity = deposit
+            balance = price - deposit
+
+        if owned and balance > 0:
+            interest = balance * _MORTGAGE_AMORTIZATION_RATE
+            principal = max(0.0, cost - interest)
+            balance = max(0.0, balance - principal)
+            equity += principal
+
+    return housing_cost, investments_start, equity_start, investments, equity, balance, owned
+
+
+if NUMBA_SUPPORT:
+    _phase_state_kernel = njit(cache=True)(_phase_state_kernel)
+
+
 class GenericCalculationEngine:
     """Generic calculation engine that processes any template type."""
 
@@ -419,7 +768,10 @@ class GenericCalculationEngine:
     def calculate_scenario_from_templates(self, scenario_id: str) -> UnifiedFinancialScenario:
         """Unified calculation for all scenario types."""
         config = self.template_engine.load_scenario(scenario_id)
+        return self.calculate_scenario(config)
 
+    def calculate_scenario(self, config: ResolvedScenarioConfig) -> UnifiedFinancialScenario:
+        """Calculate a scenario from an already-resolved configuration."""
         # Same logic for single-phase and multi-phase
         return self._calculate_phase_based_scenario(config)
 
@@ -431,13 +783,31 @@ class GenericCalculationEngine:
         scenario = self._create_scenario_shell(config)
         state = self._initialize_state(config)
 
-        for year in range(1, config.planning['duration_years'] + 1):
-            # Get current phase (works for 1 or multiple phases)
-            current_phase = self._get_phase_for_year(config.phases, year)
+        duration = config.planning['duration_years']
 
-            # Same calculation logic regardless of scenario type
-            yearly_data, state = self._calculate_year_with_phase(year, current_phase, state, config)
-            scenario.add_data_point(yearly_data)
+        # The expense template and salary schedule only depend on the phase,
+        # so work them out once per phase
+        expense_templates = {
+            id(phase): self.template_engine._load_template('expense_profiles', phase.expense_profile)
+            for phase in config.phases
+        }
+        salary_schedules = {
+            id(phase): self._build_salary_schedule(phase.salary_progression, duration)
+            for phase in config.phases
+        }
+
+        # Consecutive years sharing a phase are calculated as one batch
+        year_phases = self._build_phase_table(config.phases, duration)
+        first_year = 1
+        for _, run in groupby(year_phases, key=id):
+            phases = list(run)
+            phase = phases[0]
+            last_year = first_year + len(phases) - 1
+            scenario.add_data_points_columnar(**self._calculate_phase_vectorized(
+                np.arange(first_year, last_year + 1), phase, state, config,
+                expense_templates[id(phase)], salary_schedules[id(phase)]
+            ))
+            first_year = last_year + 1
 
         return scenario
 
@@ -449,7 +819,7 @@ class GenericCalculationEngine:
         first_phase = config.phases[0]
 
         metadata = ScenarioMetadata(
-            jurisdiction=self._determine_jurisdiction_from_location(first_phase.location_market),
+            jurisdiction=self._phase_jurisdiction(first_phase),
             tax_system=first_phase.tax_system.get('tax_system_id', 'unknown'),
             housing_strategy=first_phase.housing_strategy.get('metadata', {}).get('name', 'unknown'),
             salary_progression=first_phase.salary_progression.get('metadata', {}).get('name', 'unknown'),
@@ -460,116 +830,140 @@ class GenericCalculationEngine:
         return UnifiedFinancialScenario(
             name=config.scenario_metadata['name'],
             description=config.scenario_metadata.get('description', ''),
-            phase=self._determine_overall_phase_enum(config),
+            phase=config.phase_enum or self._determine_overall_phase_enum(config),
             data_points=[],
             metadata=metadata
         )
 
-    def _get_phase_for_year(self, phases: List[PhaseConfig], year: int) -> PhaseConfig:
-        """Works for single-phase (1 item) and multi-phase (multiple items)."""
-        for phase in phases:
-            if phase.start_year <= year <= phase.end_year:
-                return phase
-        raise ValueError(f"No phase found for year {year}")
-
-    def _calculate_year_with_phase(self, year: int, phase: PhaseConfig, state: Dict, config: ResolvedScenarioConfig) -> tuple[UnifiedFinancialData, Dict]:
-        """Shared calculation logic - same for all scenario types."""
-
-        # Calculate calendar year and age
-        calendar_year = config.planning['start_year'] + year - 1
-        age = config.planning['start_age'] + year - 1
-
-        # Use existing calculation methods with phase-specific templates
-        income = self._calc_income(year, phase.salary_progression, state)
-        taxes = self._calc_taxes(income, phase.tax_system, calendar_year)
+    def _build_phase_table(self, phases: List[PhaseConfig], duration: int) -> List[PhaseConfig]:
+        """Phase for each plan year (index = year - 1), the first listed phase winning any overlap."""
+        # Common case: one phase spanning the whole plan
+        if len(phases) == 1 and phases[0].start_year <= 1 and phases[0].end_year >= duration:
+            return [phases[0]] * duration
+
+        table = [None] * duration
+        for phase in reversed(phases):
+            start = max(phase.start_year, 1)
+            end = min(phase.end_year, duration)
+            if start <= end:
+                table[start - 1:end] = [phase] * (end - start + 1)
+
+        if None in table:
+            raise ValueError(f"No phase found for year {table.index(None) + 1}")
+        return table
+
+    def _calculate_phase_vectorized(self, years: np.ndarray, phase: PhaseConfig, state: Dict,
+                                    config: ResolvedScenarioConfig, expense_template: Dict,
+                                    salary_schedule: Optional[List[float]] = None) -> Dict[str, Any]:
+        """
+        Calculate a run of consecutive plan years that share one phase.
+
+        Income, taxes, expenses and investments do not depend on the running
+        state, so they are computed as arrays over the whole run; housing and
+        the state update run through _phase_state_kernel. Returns the keyword
+        arguments for UnifiedFinancialScenario.add_data_points_columnar.
+        """
+        calendar_years = config.planning['start_year'] + years - 1
+        ages = config.planning['start_age'] + years - 1
+
+        income = self._calc_income_vec(years, phase.salary_progression, salary_schedule)
+        taxes = self._calc_taxes_vec(income['total'], phase.tax_system)
         net_income = income['total'] - taxes['total']
 
-        # Load expense template from profile name
-        expense_template = self.template_engine._load_template('expense_profiles', phase.expense_profile)
-        expenses = self._calc_expenses(year, expense_template, net_income)
-        housing = self._calc_housing(year, phase.housing_strategy, state)
-        investments = self._calc_investments(year, phase.investment_strategy, net_income, state)
+        expenses = self._calc_expenses_vec(years, expense_template, net_income)
+        investments = self._calc_investments_vec(years, phase.investment_strategy, net_income)
 
         # Determine location-specific properties from phase
-        jurisdiction = self._determine_jurisdiction_from_location(phase.location_market)
-        currency = self._determine_currency_from_location(phase.location_market)
-
-        yearly_data = UnifiedFinancialData(
-            year=calendar_year,
-            age=age,
-            phase=self._determine_overall_phase_enum(config),
-            jurisdiction=jurisdiction,
-            currency=currency,
-            income=create_unified_income_breakdown(
-                salary_gbp=income['salary'], bonus_gbp=income['bonus'],
-                rsu_gbp=income['equity'], other_income_gbp=0.0),
-            expenses=create_unified_expense_breakdown(
-                housing_gbp=housing['cost'], living_gbp=expenses['total'],
-                taxes_gbp=taxes['total'], investments_gbp=investments['total'], other_gbp=0.0),
-            tax=create_unified_tax_breakdown(
-                income_tax_gbp=taxes['income'], social_security_gbp=taxes['social'],
-                other_taxes_gbp=taxes.get('other', 0.0)),
-            investments=create_unified_investment_breakdown(
-                retirement_gbp=investments['retirement'], taxable_gbp=investments['taxable'],
-                housing_gbp=state.get('property_equity', 0.0)),
-            net_worth=create_unified_net_worth_breakdown(
-                liquid_assets_gbp=state.get('total_investments', 0.0),
-                illiquid_assets_gbp=state.get('property_equity', 0.0),
-                liabilities_gbp=state.get('total_liabilities', 0.0)),
-            exchange_rates=self._get_exchange_rates_for_location(phase.location_market, year)
+        jurisdiction = self._phase_jurisdiction(phase)
+        currency = phase.currency or self._determine_currency_from_location(phase.location_market)
+        overall_phase = config.phase_enum or self._determine_overall_phase_enum(config)
+
+        # Housing and the savings state are the only year-to-year dependencies
+        housing = phase.housing_strategy
+        buys = housing['strategy'] != 'rent'
+        purchase = housing['purchase'] if buys else {}
+        housing_cost, investments_start, equity_start, *final_state = _phase_state_kernel(
+            years, net_income - expenses['total'], float(housing['rental']['monthly_cost'] * 12), buys,
+            purchase.get('target_year', 0), float(purchase.get('property_price', 0.0)),
+            float(purchase.get('deposit_percentage', 0.0)), float(purchase.get('purchase_fees_pct', 0.0)),
+            float(purchase.get('mortgage_rate', 0.0)), purchase.get('mortgage_term_years', 0),
+            float(state['total_investments']), float(state['property_equity']),
+            float(state['mortgage_balance']), bool(state['property_owned'])
         )
 
-        # Update state for next year
-        annual_savings = max(0, net_income - expenses['total'] - housing['cost'])
-        self._update_state(state, year, housing, annual_savings)
+        columns = {
+            'years': calendar_years,
+            'ages': ages,
+            'phase': overall_phase,
+            'jurisdiction': jurisdiction,
+            'currency': currency,
+            'exchange_rates': [self._get_exchange_rates_for_location(phase.location_market, year)
+                               for year in years.tolist()],
+            'income_cols': {'salary_gbp': income['salary'], 'bonus_gbp': income['bonus'],
+                            'rsu_gbp': income['equity']},
+            'expense_cols': {'housing_gbp': housing_cost, 'living_gbp': expenses['total'],
+                             'taxes_gbp': taxes['total'], 'investments_gbp': investments['total']},
+            'tax_cols': {'income_tax_gbp': taxes['income'], 'social_security_gbp': taxes['social'],
+                         'other_taxes_gbp': taxes['other']},
+            'investment_cols': {'retirement_gbp': investments['retirement'], 'taxable_gbp': investments['taxable'],
+                                'housing_gbp': equity_start},
+            'net_worth_cols': {'liquid_assets_gbp': investments_start, 'illiquid_assets_gbp': equity_start,
+                               'liabilities_gbp': np.full(len(years), state.get('total_liabilities', 0.0),
+                                                          dtype=np.float64)},
+        }
+
+        # Carry the state into the next phase
+        total_investments, property_equity, mortgage_balance, property_owned = final_state
+        state['total_investments'] = float(total_investments)
+        state['property_equity'] = float(property_equity)
+        state['mortgage_balance'] = float(mortgage_balance)
+        state['property_owned'] = bool(property_owned)
 
-        return yearly_data, state
+        return columns
 
     def _determine_jurisdiction_from_location(self, location_market: str) -> Jurisdiction:
         """Shared jurisdiction logic - used by both scenario types."""
-        if location_market.startswith('us_'):
-            return Jurisdiction.US
-        elif location_market.startswith('uae_'):
-            return Jurisdiction.UAE
-        else:
-            return Jurisdiction.UK
+        return _jurisdiction_for_location(location_market)
 
     def _determine_currency_from_location(self, location_market: str) -> Currency:
         """Shared currency logic - used by both scenario types."""
-        if location_market.startswith('us_') or location_market.startswith('uae_'):
-            return Currency.USD
-        else:
-            return Currency.GBP
+        return _currency_for_location(location_market)
+
+    def _phase_jurisdiction(self, phase: PhaseConfig) -> Jurisdiction:
+        """Jurisdiction resolved at load time, derived here for hand-built phases."""
+        return phase.jurisdiction or self._determine_jurisdiction_from_location(phase.location_market)
 
     def _determine_overall_phase_enum(self, config: ResolvedScenarioConfig) -> FinancialPhase:
         """Determine overall phase enum based on phase structure."""
-        if len(config.phases) == 1:
-            location = config.phases[0].location_market
-            if location.startswith('us_') or location.startswith('uae_'):
-                return FinancialPhase.INTERNATIONAL_ONLY
-            else:
-                return FinancialPhase.UK_ONLY
-        else:
-            # Multi-phase - check if it goes UK -> International
-            first_location = config.phases[0].location_market
-            has_international = any(p.location_market.startswith(('us_', 'uae_')) for p in config.phases)
-
-            if first_location == 'uk' and has_international:
-                return FinancialPhase.UK_TO_INTERNATIONAL
-            else:
-                return FinancialPhase.INTERNATIONAL_ONLY
+        return _overall_phase_for(config.phases)
 
-    def _get_exchange_rates_for_location(self, location_market: str, year: int) -> Dict[Currency, float]:
-        """Get exchange rates for a location."""
+    def _get_exchange_rates_for_location(self, location_market: str, year: int) -> Mapping[Currency, float]:
+        """Get exchange rates for a location (a shared, read-only mapping)."""
         # For now, return simple rates (can be enhanced later)
-        return {Currency.GBP: 1.0, Currency.USD: 1.26, Currency.EUR: 1.15}
+        return _DEFAULT_EXCHANGE_RATES
 
     # Helper methods for calculations
-    def _calc_income(self, year: int, template: Dict, state: Dict) -> Dict:
-        """Calculate all income components."""
+    def _build_salary_schedule(self, template: Dict, duration: int) -> List[float]:
+        """Base salary for years 1..duration, compounding growth in one pass."""
         prog = template['progression']
 
-        # Calculate base salary
+        if prog['type'] == 'explicit_array':
+            # Years past the array are only covered when a fallback is configured;
+            # _calc_income_vec computes any others on demand, as before
+            years = duration if 'fallback' in prog else min(duration, len(prog['salary_by_year']))
+            return [self._calc_base_salary(year, prog) for year in range(1, years + 1)]
+
+        # percentage_growth: same running product _calc_base_salary computes per year
+        salary = prog['base_salary']
+        schedule = [salary]
+        for y in range(2, duration + 1):
+            rate = self._section_rate(prog, 'growth_by_year', y)
+            if rate: salary *= (1 + rate)
+            schedule.append(salary)
+        return schedule
+
+    def _calc_base_salary(self, year: int, prog: Dict) -> float:
+        """Base salary for a single year of a salary progression."""
         if prog['type'] == 'explicit_array':
             salary_array = prog['salary_by_year']
             if year <= len(salary_array):
@@ -580,147 +974,129 @@ class GenericCalculationEngine:
         else:  # percentage_growth
             salary = prog['base_salary']
             for y in range(2, year + 1):
-                rate = self._get_rate(y, prog['growth_by_year'])
+                rate = self._section_rate(prog, 'growth_by_year', y)
                 if rate: salary *= (1 + rate)
+        return salary
+
+    def _calc_income_vec(self, years: np.ndarray, template: Dict,
+                         salary_schedule: Optional[List[float]] = None) -> Dict[str, np.ndarray]:
+        """Salary, bonus, equity and total income over a run of plan years."""
+        prog = template['progression']
+        covered = len(salary_schedule) if salary_schedule is not None else 0
+        salary = np.array([
+            salary_schedule[year - 1] if year <= covered else self._calc_base_salary(year, prog)
+            for year in years.tolist()
+        ], dtype=np.float64)
 
-        # Calculate bonus and equity using unified percentage calculator
-        bonus = self._calc_percentage_component(salary, year, template['bonus'])
-        equity = self._calc_percentage_component(salary, year, template['equity'])
+        bonus = self._calc_percentage_component_vec(salary, years, template['bonus'])
+        equity = self._calc_percentage_component_vec(salary, years, template['equity'])
 
         # Apply special events to equity
-        if 'events' in template['equity']:
-            for event in template['equity']['events']:
-                if event.get('year') == year and event.get('type') == 'ipo_multiplier':
-                    equity *= event['multiplier']
+        for event in template['equity'].get('events', ()):
+            if event.get('type') == 'ipo_multiplier':
+                equity[years == event.get('year')] *= event['multiplier']
 
         return {'salary': salary, 'bonus': bonus, 'equity': equity, 'total': salary + bonus + equity}
 
-    def _calc_taxes(self, income: Dict, template: Dict, year: int) -> Dict:
-        """Calculate taxes using template system."""
+    def _calc_taxes_vec(self, gross_income: np.ndarray, template: Dict) -> Dict[str, np.ndarray]:
+        """Taxes on gross income over a run of plan years, with one tax system lookup for the whole run."""
         if not TAX_SUPPORT:
             raise ValueError("Tax calculation support not available")
 
         try:
-            result = calculate_yaml_tax_for_location(
-                gross_income=income['total'], tax_system_id=template['tax_system_id'],
-                year=year, loan_balance=0)
+            result = calculate_yaml_tax_for_location_vec(
+                gross_income=gross_income, tax_system_id=template['tax_system_id'], loan_balance=0)
             return {
                 'income': result['income_tax'], 'social': result['social_security'],
-                'other': result.get('student_loan', 0), 'total': result['total_tax']
+                'other': result['student_loan'], 'total': result['total_tax']
             }
         except Exception as e:
             raise ValueError(f"Tax calculation failed: {e}")
 
-    def _calc_expenses(self, year: int, template: Dict, net_income: float) -> Dict:
-        """Calculate expenses from template."""
+    def _calc_expenses_vec(self, years: np.ndarray, template: Dict,
+                           net_income: np.ndarray) -> Dict[str, np.ndarray]:
+        """Living expenses from an expense template over a run of plan years."""
         monthly = sum(template.get('monthly_expenses', {}).values())
         annual = sum(template.get('annual_expenses', {}).values())
         base = monthly * 12 + annual
+        total = np.full(len(years), base, dtype=np.float64)
 
         # Apply progression adjustments if configured
         if 'progression' in template and 'adjustments_by_year' in template['progression']:
-            for year_range, adj in template['progression']['adjustments_by_year'].items():
-                if self._in_range(year, year_range):
-                    income_based = net_income * adj.get('income_percentage', 0)
-                    lifestyle_adjusted = base * adj.get('lifestyle_factor', 1.0)
-                    base = max(lifestyle_adjusted, income_based)
-                    break
-
-        return {'total': base}
-
-    def _calc_housing(self, year: int, template: Dict, state: Dict) -> Dict:
-        """Calculate housing costs."""
-        strategy = template['strategy']
-
-        if strategy == 'rent':
-            return self._rental_cost(template)
-
-        # Buy strategy
-        purchase = template['purchase']
-        purchase_year = purchase['target_year']
-
-        if year == purchase_year and not state.get('property_owned'):
-            # Purchase year
-            price = purchase['property_price']
-            deposit = price * purchase['deposit_percentage']
-            fees = price * purchase['purchase_fees_pct']
-            return {
-                'cost': deposit + fees, 'purchased': True,
-                'equity': deposit, 'price': price
-            }
-        elif year > purchase_year and state.get('property_owned') and state.get('mortgage_balance', 0) > 0:
-            # Mortgage payments
-            monthly = self._mortgage_payment(
-                state['mortgage_balance'], purchase['mortgage_rate'], purchase['mortgage_term_years'])
-            return {'cost': monthly * 12, 'purchased': False, 'equity': state.get('property_equity', 0)}
-
-        # Default to rental
-        return self._rental_cost(template)
-
-    def _calc_investments(self, year: int, template: Optional[Dict], net_income: float, state: Dict) -> Dict:
-        """Calculate investment allocations - template can be None if not configured."""
+            adjustments = [self._section_adjustment(template['progression'], year) for year in years.tolist()]
+            adjusted = np.array([adj is not None for adj in adjustments], dtype=bool)
+            if adjusted.any():
+                matched = [adj for adj in adjustments if adj is not None]
+                lifestyle_factor = np.array([adj.get('lifestyle_factor', 1.0) for adj in matched], dtype=np.float64)
+                income_percentage = np.array([adj.get('income_percentage', 0) for adj in matched], dtype=np.float64)
+                total[adjusted] = np.maximum(base * lifestyle_factor, net_income[adjusted] * income_percentage)
+
+        return {'total': total}
+
+    def _calc_investments_vec(self, years: np.ndarray, template: Optional[Dict],
+                              net_income: np.ndarray) -> Dict[str, np.ndarray]:
+        """Investment contributions and their allocation over a run of plan years - template can be None."""
         if template is None:
-            return {'total': 0, 'retirement': 0, 'taxable': 0}
-
-        # Calculate target investment
-        pct = template['contribution_rules']['regular_contributions']['percentage_of_income']
-        target = net_income * pct
+            zeros = np.zeros(len(years), dtype=np.float64)
+            return {'total': zeros, 'retirement': zeros, 'taxable': zeros}
 
-        # Apply limits
         contrib = template['contribution_rules']['regular_contributions']
+        target = net_income * contrib['percentage_of_income']
         if 'minimum_monthly' in contrib and 'maximum_monthly' in contrib:
-            target = max(contrib['minimum_monthly'] * 12,
-                        min(target, contrib['maximum_monthly'] * 12))
+            target = np.maximum(contrib['minimum_monthly'] * 12,
+                                np.minimum(target, contrib['maximum_monthly'] * 12))
 
-        # Allocate by career stage
-        stage = self._career_stage(year)
-        retire_pct = template['allocation']['by_career_stage'][stage]['retirement_percentage']
+        by_stage = template['allocation']['by_career_stage']
+        retire_pct = np.array([
+            by_stage[self._career_stage(year)]['retirement_percentage'] for year in years.tolist()
+        ], dtype=np.float64)
         retirement = target * retire_pct
 
         return {'total': target, 'retirement': retirement, 'taxable': target - retirement}
 
     # Utility methods
-    def _calc_percentage_component(self, base: float, year: int, config: Dict) -> float:
-        """Unified percentage-based calculation for bonus/equity."""
+    def _calc_percentage_component_vec(self, base: np.ndarray, years: np.ndarray, config: Dict) -> np.ndarray:
+        """Unified percentage-based calculation for bonus/equity, per plan year."""
         if config['type'] == 'percentage_of_salary':
-            rate = self._get_rate(year, config['rates_by_year'], 0.0)
-            return base * rate
-        return 0.0
+            rates = np.array([self._section_rate(config, 'rates_by_year', year, 0.0) for year in years.tolist()],
+                             dtype=np.float64)
+            return base * rates
+        return np.zeros_like(base)
 
-    def _rental_cost(self, template: Dict) -> Dict:
-        """Standard rental cost calculation."""
-        monthly = template['rental']['monthly_cost']
-        return {'cost': monthly * 12, 'purchased': False, 'equity': 0.0}
-
-    def _get_rate(self, year: int, rates: Union[List, Dict], default: float = None) -> Optional[float]:
+    def _get_rate(self, year: int, rates: Union[List, Dict], default: Optional[float] = None) -> Optional[float]:
         """Get rate for year from various formats."""
         if isinstance(rates, list):
             return rates[year - 1] if year <= len(rates) else default
 
         # Dict format: handle ranges, exact years, open-ended
         for key, rate in rates.items():
-            if isinstance(key, str):
-                if '-' in key:
-                    start, end = map(int, key.split('-'))
-                    if start <= year <= end: return rate
-                elif key.endswith('+') and year >= int(key[:-1]): return rate
-            elif key == year: return rate
+            if _rate_key_matches(key, year): return rate
         return default
 
+    def _get_rate_fast(self, compiled: Tuple, year: int, default: Optional[float] = None) -> Optional[float]:
+        """Get rate for year (>= 1) from a table built by _compile_year_map."""
+        rate = compiled[min(year, len(compiled)) - 1]
+        return default if rate is None else rate
+
+    def _section_rate(self, section: Dict, key: str, year: int, default: Optional[float] = None) -> Optional[float]:
+        """Get rate for year from section[key], using its compiled table when the template has one."""
+        compiled = section.get('_compiled', {}).get(key)
+        if compiled is not None and year >= 1:
+            return self._get_rate_fast(compiled, year, default)
+        return self._get_rate(year, section[key], default)
+
+    def _section_adjustment(self, progression: Dict, year: int) -> Optional[Dict]:
+        """First adjustments_by_year entry covering year, or None."""
+        compiled = progression.get('_compiled', {}).get('adjustments_by_year')
+        if compiled is not None and year >= 1:
+            return self._get_rate_fast(compiled, year)
+        for year_range, adj in progression['adjustments_by_year'].items():
+            if self._in_range(year, year_range): return adj
+        return None
+
     def _in_range(self, year: int, range_str: str) -> bool:
         """Check if year is in range string."""
-        if '+' in range_str: return year >= int(range_str.replace('+', ''))
-        if '-' in range_str:
-            start, end = map(int, range_str.split('-'))
-            return start <= year <= end
-        return year == int(range_str)
-
-    def _mortgage_payment(self, principal: float, annual_rate: float, term_years: int) -> float:
-        """Calculate monthly mortgage payment."""
-        monthly_rate = annual_rate / 12
-        num_payments = term_years * 12
-        if monthly_rate == 0: return principal / num_payments
-        return principal * (monthly_rate * (1 + monthly_rate)**num_payments) / ((1 + monthly_rate)**num_payments - 1)
+        return _range_matches(range_str, year)
 
     def _career_stage(self, year: int) -> str:
         """Determine career stage."""
@@ -844,26 +1220,6 @@ class GenericCalculationEngine:
             'property_owned': False, 'year_in_location': 1
         }
 
-    def _update_state(self, state: Dict, year: int, housing: Dict, annual_savings: float) -> None:
-        """Update state for next year."""
-        # Update investments
-        state['total_investments'] = state['total_investments'] * 1.065 + annual_savings
-
-        # Update property state
-        if housing.get('purchased'):
-            state['property_owned'] = True
-            state['property_equity'] = housing['equity']
-            if 'price' in housing:
-                state['mortgage_balance'] = housing['price'] - housing['equity']
-
-        # Update mortgage
-        if state.get('property_owned') and state.get('mortgage_balance', 0) > 0:
-            annual_payment = housing.get('cost', 0)
-            interest = state['mortgage_balance'] * 0.05
-            principal = max(0, annual_payment - interest)
-            state['mortgage_balance'] = max(0, state['mortgage_balance'] - principal)
-            state['property_equity'] += principal
-
 
 # Convenience functions for external use
 def load_scenario_from_templates(scenario_id: str, config_root: str = "config") -> UnifiedFinancialScenario:
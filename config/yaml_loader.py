@@ -3,30 +3,57 @@ Simple YAML Configuration Loader
 Provides optional YAML loading with fallback to legacy CONFIG.
 """
 
+import copy
 import yaml
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-import sys
-import os
+from typing import Optional, Dict, Any, List, Tuple
 
-# Import the legacy CONFIG directly
-parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-config_path = os.path.join(parent_dir, 'config.py')
+# Prefer the libyaml-backed loader; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# The legacy CONFIG is loaded lazily (and only once) by the config package
+import config as config_package
+
+
+def __getattr__(name):
+    if name == 'LEGACY_CONFIG':
+        return config_package.CONFIG
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Parsed files keyed by path, validated against the file's (mtime_ns, size)
+_PARSED_YAML: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+
+def _load_yaml(path: Path) -> Any:
+    """
+    Parse a YAML file, reusing the previous parse while the file is unchanged.
+
+    Each caller gets its own deep copy, so mutating the result cannot leak
+    into later loads.
+    """
+    stat = path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    key = str(path)
+    entry = _PARSED_YAML.get(key)
+    if entry is not None and entry[0] == signature:
+        return copy.deepcopy(entry[1])
+
+    with open(path, 'r', encoding='utf-8') as f:
+        data = yaml.load(f, Loader=SafeLoader)
+    _PARSED_YAML[key] = (signature, data)
+    return copy.deepcopy(data)
 
-# Load the config module dynamically to avoid circular imports
-import importlib.util
-spec = importlib.util.spec_from_file_location("config_module", config_path)
-config_module = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(config_module)
-LEGACY_CONFIG = config_module.CONFIG
 
 def try_load_scenario(scenario_id: str) -> Optional[Dict[str, Any]]:
     """Try to load scenario from YAML, return None if not found."""
     try:
         path = Path(__file__).parent / "scenarios" / f"{scenario_id}.yaml"
         if path.exists():
-            with open(path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+            return _load_yaml(path)
     except Exception:
         pass  # Fail silently, use legacy fallback
     return None
@@ -37,14 +64,12 @@ def try_load_tax_system(tax_id: str) -> Optional[Dict[str, Any]]:
         # Try main tax systems directory
         path = Path(__file__).parent / "tax_systems" / f"{tax_id}.yaml"
         if path.exists():
-            with open(path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+            return _load_yaml(path)
         
         # Try US states subdirectory
         us_states_path = Path(__file__).parent / "tax_systems" / "us_states" / f"{tax_id.replace('us_', '')}.yaml"
         if us_states_path.exists():
-            with open(us_states_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+            return _load_yaml(us_states_path)
     except Exception:
         pass
     return None
@@ -98,8 +123,9 @@ def get_tax_system_for_location(location: str) -> str:
 class SimpleConfigFallback:
     """Simple wrapper that tries YAML first, falls back to legacy CONFIG."""
     
-    def __init__(self):
-        self.legacy_config = LEGACY_CONFIG
+    @property
+    def legacy_config(self) -> Dict[str, Any]:
+        return config_package.CONFIG
     
     def get_scenario_config(self, scenario_name: str) -> Dict[str, Any]:
         """Get scenario config with YAML fallback."""
@@ -3,12 +3,14 @@ Unified Financial Data Models using Pydantic
 Defines the unified data structures for financial scenarios with currency-agnostic design.
 """
 
-from pydantic import BaseModel, Field, computed_field
-from typing import Dict, List, Optional, Any
+from pydantic import BaseModel, Field, PrivateAttr, TypeAdapter, computed_field
+from typing import Dict, List, Mapping, Optional, Any, Sequence
 from enum import Enum
 from datetime import datetime
 from dataclasses import dataclass
 
+import numpy as np
+
 
 # 1. CORE CONCEPTS
 class Currency(str, Enum):
@@ -47,6 +49,9 @@ class PhaseConfig:
     housing_strategy: Dict[str, Any]
     tax_system: Dict[str, Any]
     investment_strategy: Optional[Dict[str, Any]] = None
+    # Resolved from location_market when the phase is loaded
+    jurisdiction: Optional[Jurisdiction] = None
+    currency: Optional[Currency] = None
 
 
 @dataclass
@@ -56,6 +61,7 @@ class ResolvedScenarioConfig:
     planning: Dict[str, Any]
     phases: List[PhaseConfig]  # Always a list (1+ phases)
     is_multi_phase: bool       # Just metadata flag
+    phase_enum: Optional[FinancialPhase] = None  # Overall phase, resolved at load time
 
 
 # 4. CURRENCY VALUE WRAPPER
@@ -479,17 +485,115 @@ class ScenarioMetadata(BaseModel):
 
 # 6. UNIFIED SCENARIO
 class UnifiedFinancialScenario(BaseModel):
-    """Unified financial scenario."""
+    """
+    Unified financial scenario.
+
+    Data points can be added one at a time or as column batches
+    (add_data_points_columnar); batches are kept as NumPy arrays (int32 years
+    and ages, float64 amounts) and only turned into UnifiedFinancialData
+    objects when data_points is first read.
+    """
     name: str = Field(..., description="Scenario name")
     description: str = Field("", description="Scenario description")
     phase: FinancialPhase = Field(..., description="Financial phase")
-    data_points: List[UnifiedFinancialData] = Field(default_factory=list, description="Financial data points")
     metadata: Optional[ScenarioMetadata] = Field(None, description="Scenario metadata")
 
+    _data_points: List[UnifiedFinancialData] = PrivateAttr(default_factory=list)
+    _pending_columns: List[Dict[str, Any]] = PrivateAttr(default_factory=list)
+
+    def __init__(self, data_points: Optional[Sequence[UnifiedFinancialData]] = None, **data: Any):
+        super().__init__(**data)
+        if data_points:
+            self._data_points = _DATA_POINTS_ADAPTER.validate_python(list(data_points))
+
+    @computed_field(description="Financial data points")
+    @property
+    def data_points(self) -> List[UnifiedFinancialData]:
+        """Year-by-year data points, materializing any pending column batches."""
+        if self._pending_columns:
+            self._materialize_columns()
+        return self._data_points
+
+    @data_points.setter
+    def data_points(self, data_points: Sequence[UnifiedFinancialData]) -> None:
+        self._pending_columns = []
+        self._data_points = _DATA_POINTS_ADAPTER.validate_python(list(data_points))
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Compare fields and data points, as for a model with a data_points field.
+
+        Pending column batches hold NumPy arrays and may be split differently
+        on each side, so both sides are compared on their materialized data
+        points rather than on private state.
+        """
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        return (type(self) is type(other)
+                and self.__dict__ == other.__dict__
+                and self.data_points == other.data_points)
+
+    # Mutable, so unhashable like any non-frozen model
+    __hash__ = None  # type: ignore[assignment]
+
+    def __getitem__(self, index: int) -> UnifiedFinancialData:
+        """Data point by position, building only that row while it is still columnar."""
+        if not self._pending_columns:
+            return self._data_points[index]
+
+        count = len(self._data_points) + sum(len(batch['years']) for batch in self._pending_columns)
+        position = range(count)[index]  # normalizes negative indexes, raises IndexError
+        if position < len(self._data_points):
+            return self._data_points[position]
+
+        position -= len(self._data_points)
+        for batch in self._pending_columns:
+            if position < len(batch['years']):
+                break
+            position -= len(batch['years'])
+        return _build_data_point(_batch_lists(batch), position)
+
     def add_data_point(self, data_point: UnifiedFinancialData) -> None:
         """Add a data point to the scenario."""
         self.data_points.append(data_point)
 
+    def add_data_points_columnar(self, *, years: Sequence[int], ages: Sequence[int], phase: FinancialPhase,
+                                 jurisdiction: Jurisdiction, currency: Currency,
+                                 exchange_rates: Sequence[Mapping[Currency, float]],
+                                 income_cols: Dict[str, Sequence[float]],
+                                 expense_cols: Dict[str, Sequence[float]],
+                                 tax_cols: Dict[str, Sequence[float]],
+                                 investment_cols: Dict[str, Sequence[float]],
+                                 net_worth_cols: Dict[str, Sequence[float]]) -> None:
+        """
+        Append a run of years sharing phase, jurisdiction and currency.
+
+        Each ``*_cols`` dict maps the keyword arguments of the matching
+        create_unified_*_breakdown helper to one value per year (arrays or
+        lists); ``exchange_rates`` has one mapping per year, copied so the
+        batch owns (and can pickle) them.
+        """
+        self._pending_columns.append({
+            'years': np.array(years, dtype=np.int32),
+            'ages': np.array(ages, dtype=np.int32),
+            'phase': phase,
+            'jurisdiction': jurisdiction,
+            'currency': currency,
+            'exchange_rates': [dict(rates) for rates in exchange_rates],
+            'income': _float_columns(income_cols),
+            'expenses': _float_columns(expense_cols),
+            'tax': _float_columns(tax_cols),
+            'investments': _float_columns(investment_cols),
+            'net_worth': _float_columns(net_worth_cols),
+        })
+
+    def _materialize_columns(self) -> None:
+        """Turn every pending column batch into UnifiedFinancialData, in order."""
+        pending, self._pending_columns = self._pending_columns, []
+        for batch in pending:
+            rows = _batch_lists(batch)
+            self._data_points.extend(_build_data_point(rows, i) for i in range(len(rows['years'])))
+
     def get_final_net_worth_gbp(self) -> float:
         """Get final net worth in GBP."""
         if not self.data_points:
@@ -539,3 +643,66 @@ class UnifiedFinancialScenario(BaseModel):
         validate_assignment = True
         extra = "forbid"
         from_attributes = True
+
+
+_DATA_POINTS_ADAPTER = TypeAdapter(List[UnifiedFinancialData])
+
+
+def _float_columns(columns: Dict[str, Sequence[float]]) -> Dict[str, np.ndarray]:
+    """
+    Copy columns into float64 arrays.
+
+    Amounts stay in double precision: net worth reaches eight figures, where
+    float32 can no longer represent whole pounds and the reports would change.
+    """
+    return {key: np.array(values, dtype=np.float64) for key, values in columns.items()}
+
+
+def _batch_lists(batch: Dict[str, Any]) -> Dict[str, Any]:
+    """Column batch with years, ages and every breakdown field as Python lists."""
+    # Imported here: unified_helpers imports this module
+    from .unified_helpers import breakdown_columns
+
+    rows = dict(batch)
+    rows['years'] = batch['years'].tolist()
+    rows['ages'] = batch['ages'].tolist()
+    rows['fields'] = breakdown_columns(batch)
+    return rows
+
+
+def _build_data_point(rows: Dict[str, Any], i: int) -> UnifiedFinancialData:
+    """Build row ``i`` of a column batch converted by _batch_lists."""
+    # Imported here: performance_optimizations imports this module
+    from .performance_optimizations import optimize_currency_value_creation
+
+    fields = rows['fields']
+
+    def build(model: type, section: str) -> BaseModel:
+        return model(**{
+            field: optimize_currency_value_creation(values[i], Currency.GBP)
+            for field, values in fields[section].items()
+        })
+
+    return UnifiedFinancialData(
+        year=rows['years'][i],
+        age=rows['ages'][i],
+        phase=rows['phase'],
+        jurisdiction=rows['jurisdiction'],
+        currency=rows['currency'],
+        income=build(IncomeBreakdown, 'income'),
+        expenses=ExpenseBreakdown(
+            housing=build(HousingExpenses, 'housing_expenses'),
+            living=build(LivingExpenses, 'living_expenses'),
+            taxes=build(TaxExpenses, 'tax_expenses'),
+            investments=build(InvestmentExpenses, 'investment_expenses'),
+            other=build(OtherExpenses, 'other_expenses'),
+        ),
+        tax=build(TaxBreakdown, 'tax'),
+        investments=InvestmentBreakdown(
+            retirement=build(RetirementInvestments, 'retirement'),
+            taxable=build(TaxableInvestments, 'taxable'),
+            housing=build(HousingInvestments, 'housing_investments'),
+        ),
+        net_worth=build(NetWorthBreakdown, 'net_worth'),
+        exchange_rates=rows['exchange_rates'][i]
+    )
@@ -4,6 +4,8 @@ Helper functions for creating and managing unified financial data models.
 """
 
 from typing import Dict, Any, List
+
+import numpy as np
 from .unified_financial_data import (
     UnifiedFinancialData, UnifiedFinancialScenario, ScenarioMetadata,
     CurrencyValue, Currency, Jurisdiction, FinancialPhase,
@@ -17,6 +19,24 @@ from .performance_optimizations import (
     clear_all_caches
 )
 
+# Fixed shares used to split a total into its sub-categories; fields left out
+# of a table are always zero
+HOUSING_EXPENSE_SHARES = {'rent': 0.6, 'mortgage': 0.3, 'utilities': 0.05, 'maintenance': 0.03, 'property_tax': 0.02}
+LIVING_EXPENSE_SHARES = {'food': 0.3, 'transport': 0.25, 'healthcare': 0.15, 'entertainment': 0.15,
+                         'clothing': 0.1, 'personal_care': 0.05}
+TAX_EXPENSE_SHARES = {'income_tax': 0.8, 'social_security': 0.15, 'property_tax': 0.03, 'other_taxes': 0.02}
+INVESTMENT_EXPENSE_SHARES = {'retirement_contributions': 0.7, 'investment_fees': 0.2, 'insurance': 0.1}
+OTHER_EXPENSE_SHARES = {'education': 0.4, 'travel': 0.3, 'gifts': 0.2, 'miscellaneous': 0.1}
+RETIREMENT_SHARES = {'pension': 0.5, 'lisa': 0.25, 'sipp': 0.25}  # no IRA or employer match for UK
+TAXABLE_SHARES = {'isa': 0.5, 'gia': 0.3, 'brokerage': 0.2}  # no crypto for now
+HOUSING_INVESTMENT_SHARES = {'house_equity': 0.8, 'rental_property': 0.2}
+
+
+def _split(total: float, shares: Dict[str, float]) -> Dict[str, CurrencyValue]:
+    """Currency values for ``total`` split by ``shares``."""
+    return {field: optimize_currency_value_creation(total * share, Currency.GBP) for field, share in shares.items()}
+
+
 def create_unified_income_breakdown(
     salary_gbp: float = 0.0,
     bonus_gbp: float = 0.0,
@@ -47,22 +67,8 @@ def create_unified_expense_breakdown(
     """Create a unified expense breakdown with optimized currency values."""
     
     # Create sub-breakdowns
-    housing = HousingExpenses(
-        rent=optimize_currency_value_creation(housing_gbp * 0.6, Currency.GBP),  # Assume 60% rent
-        mortgage=optimize_currency_value_creation(housing_gbp * 0.3, Currency.GBP),  # Assume 30% mortgage
-        utilities=optimize_currency_value_creation(housing_gbp * 0.05, Currency.GBP),  # Assume 5% utilities
-        maintenance=optimize_currency_value_creation(housing_gbp * 0.03, Currency.GBP),  # Assume 3% maintenance
-        property_tax=optimize_currency_value_creation(housing_gbp * 0.02, Currency.GBP)  # Assume 2% property tax
-    )
-    
-    living = LivingExpenses(
-        food=optimize_currency_value_creation(living_gbp * 0.3, Currency.GBP),  # Assume 30% food
-        transport=optimize_currency_value_creation(living_gbp * 0.25, Currency.GBP),  # Assume 25% transport
-        healthcare=optimize_currency_value_creation(living_gbp * 0.15, Currency.GBP),  # Assume 15% healthcare
-        entertainment=optimize_currency_value_creation(living_gbp * 0.15, Currency.GBP),  # Assume 15% entertainment
-        clothing=optimize_currency_value_creation(living_gbp * 0.1, Currency.GBP),  # Assume 10% clothing
-        personal_care=optimize_currency_value_creation(living_gbp * 0.05, Currency.GBP)  # Assume 5% personal care
-    )
+    housing = HousingExpenses(**_split(housing_gbp, HOUSING_EXPENSE_SHARES))
+    living = LivingExpenses(**_split(living_gbp, LIVING_EXPENSE_SHARES))
     
     # Use actual tax calculations if config and gross_income are provided
     if config and gross_income > 0:
@@ -71,34 +77,14 @@ def create_unified_expense_breakdown(
             taxes = get_tax_breakdown_for_location(gross_income, location, year, config)
         except ImportError:
             # Fallback to simplified tax breakdown
-            taxes = TaxExpenses(
-                income_tax=optimize_currency_value_creation(taxes_gbp * 0.8, Currency.GBP),  # Assume 80% income tax
-                social_security=optimize_currency_value_creation(taxes_gbp * 0.15, Currency.GBP),  # Assume 15% social security
-                property_tax=optimize_currency_value_creation(taxes_gbp * 0.03, Currency.GBP),  # Assume 3% property tax
-                other_taxes=optimize_currency_value_creation(taxes_gbp * 0.02, Currency.GBP)  # Assume 2% other taxes
-            )
+            taxes = TaxExpenses(**_split(taxes_gbp, TAX_EXPENSE_SHARES))
     else:
         # Simplified tax breakdown
-        taxes = TaxExpenses(
-            income_tax=optimize_currency_value_creation(taxes_gbp * 0.8, Currency.GBP),  # Assume 80% income tax
-            social_security=optimize_currency_value_creation(taxes_gbp * 0.15, Currency.GBP),  # Assume 15% social security
-            property_tax=optimize_currency_value_creation(taxes_gbp * 0.03, Currency.GBP),  # Assume 3% property tax
-            other_taxes=optimize_currency_value_creation(taxes_gbp * 0.02, Currency.GBP)  # Assume 2% other taxes
-        )
+        taxes = TaxExpenses(**_split(taxes_gbp, TAX_EXPENSE_SHARES))
     
     # Simplified investment breakdown
-    investments = InvestmentExpenses(
-        retirement_contributions=optimize_currency_value_creation(investments_gbp * 0.7, Currency.GBP),  # Assume 70% retirement
-        investment_fees=optimize_currency_value_creation(investments_gbp * 0.2, Currency.GBP),  # Assume 20% fees
-        insurance=optimize_currency_value_creation(investments_gbp * 0.1, Currency.GBP)  # Assume 10% insurance
-    )
-    
-    other = OtherExpenses(
-        education=optimize_currency_value_creation(other_gbp * 0.4, Currency.GBP),  # Assume 40% education
-        travel=optimize_currency_value_creation(other_gbp * 0.3, Currency.GBP),  # Assume 30% travel
-        gifts=optimize_currency_value_creation(other_gbp * 0.2, Currency.GBP),  # Assume 20% gifts
-        miscellaneous=optimize_currency_value_creation(other_gbp * 0.1, Currency.GBP)  # Assume 10% miscellaneous
-    )
+    investments = InvestmentExpenses(**_split(investments_gbp, INVESTMENT_EXPENSE_SHARES))
+    other = OtherExpenses(**_split(other_gbp, OTHER_EXPENSE_SHARES))
     
     return ExpenseBreakdown(
         housing=housing,
@@ -132,24 +118,15 @@ def create_unified_investment_breakdown(
     
     # Create sub-breakdowns with simplified assumptions
     retirement = RetirementInvestments(
-        pension=optimize_currency_value_creation(retirement_gbp * 0.5, Currency.GBP),     # Assume 50% pension
-        lisa=optimize_currency_value_creation(retirement_gbp * 0.25, Currency.GBP),       # Assume 25% LISA
-        sipp=optimize_currency_value_creation(retirement_gbp * 0.25, Currency.GBP),       # Assume 25% SIPP
-        ira=optimize_currency_value_creation(0, Currency.GBP),                            # No IRA for UK
-        employer_match=optimize_currency_value_creation(0, Currency.GBP)                   # No employer match for UK
+        **_split(retirement_gbp, RETIREMENT_SHARES),
+        ira=optimize_currency_value_creation(0, Currency.GBP),
+        employer_match=optimize_currency_value_creation(0, Currency.GBP)
     )
-    
     taxable = TaxableInvestments(
-        isa=optimize_currency_value_creation(taxable_gbp * 0.5, Currency.GBP),      # Assume 50% ISA
-        gia=optimize_currency_value_creation(taxable_gbp * 0.3, Currency.GBP),       # Assume 30% GIA
-        brokerage=optimize_currency_value_creation(taxable_gbp * 0.2, Currency.GBP), # Assume 20% brokerage
-        crypto=optimize_currency_value_creation(0, Currency.GBP)                     # No crypto for now
-    )
-    
-    housing = HousingInvestments(
-        house_equity=optimize_currency_value_creation(housing_gbp * 0.8, Currency.GBP),  # Assume 80% house equity
-        rental_property=optimize_currency_value_creation(housing_gbp * 0.2, Currency.GBP)  # Assume 20% rental property
+        **_split(taxable_gbp, TAXABLE_SHARES),
+        crypto=optimize_currency_value_creation(0, Currency.GBP)
     )
+    housing = HousingInvestments(**_split(housing_gbp, HOUSING_INVESTMENT_SHARES))
     
     return InvestmentBreakdown(
         retirement=retirement,
@@ -172,6 +149,57 @@ def create_unified_net_worth_breakdown(
     )
 
 
+def breakdown_columns(batch: Dict[str, Any]) -> Dict[str, Dict[str, List[float]]]:
+    """
+    Field-by-field columns for every breakdown model of a column batch stored
+    by UnifiedFinancialScenario.add_data_points_columnar.
+
+    Totals are split with the same share tables as the helpers above, one NumPy
+    multiply per field, so rows can be built without calling the helpers.
+    """
+    zeros = np.zeros(len(batch['years']))
+
+    def column(section: str, key: str) -> np.ndarray:
+        return batch[section].get(key, zeros)
+
+    def split(total: np.ndarray, shares: Dict[str, float]) -> Dict[str, List[float]]:
+        return {field: (total * share).tolist() for field, share in shares.items()}
+
+    return {
+        'income': {
+            'salary': column('income', 'salary_gbp').tolist(),
+            'bonus': column('income', 'bonus_gbp').tolist(),
+            'rsu_vested': column('income', 'rsu_gbp').tolist(),
+            'other_income': column('income', 'other_income_gbp').tolist(),
+        },
+        'housing_expenses': split(column('expenses', 'housing_gbp'), HOUSING_EXPENSE_SHARES),
+        'living_expenses': split(column('expenses', 'living_gbp'), LIVING_EXPENSE_SHARES),
+        'tax_expenses': split(column('expenses', 'taxes_gbp'), TAX_EXPENSE_SHARES),
+        'investment_expenses': split(column('expenses', 'investments_gbp'), INVESTMENT_EXPENSE_SHARES),
+        'other_expenses': split(column('expenses', 'other_gbp'), OTHER_EXPENSE_SHARES),
+        'tax': {
+            'income_tax': column('tax', 'income_tax_gbp').tolist(),
+            'social_security': column('tax', 'social_security_gbp').tolist(),
+            'other_taxes': column('tax', 'other_taxes_gbp').tolist(),
+        },
+        'retirement': {
+            **split(column('investments', 'retirement_gbp'), RETIREMENT_SHARES),
+            'ira': zeros.tolist(),
+            'employer_match': zeros.tolist(),
+        },
+        'taxable': {
+            **split(column('investments', 'taxable_gbp'), TAXABLE_SHARES),
+            'crypto': zeros.tolist(),
+        },
+        'housing_investments': split(column('investments', 'housing_gbp'), HOUSING_INVESTMENT_SHARES),
+        'net_worth': {
+            'liquid_assets': column('net_worth', 'liquid_assets_gbp').tolist(),
+            'illiquid_assets': column('net_worth', 'illiquid_assets_gbp').tolist(),
+            'liabilities': column('net_worth', 'liabilities_gbp').tolist(),
+        },
+    }
+
+
 def get_performance_metrics() -> Dict[str, Any]:
     """Get performance metrics for unified models."""
     return get_performance_summary()
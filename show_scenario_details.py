@@ -30,8 +30,8 @@ class ScenarioDetailViewer:
             print(f"{'='*80}")
 
             # Calculate scenario
-            result = self.calculator.calculate_scenario_from_templates(scenario_id)
             config = self.template_engine.load_scenario(scenario_id)
+            result = self.calculator.calculate_scenario(config)
 
             # Show scenario overview
             print(f"📋 Scenario: {result.name}")
@@ -55,14 +55,17 @@ class ScenarioDetailViewer:
 
             # Year by year data
             for data_point in result.data_points:
-                net_income = data_point.income.total_gbp - data_point.tax.total_gbp
-                savings = net_income - data_point.expenses.total_gbp
+                income_total = data_point.income.total_gbp
+                tax_total = data_point.tax.total_gbp
+                expenses_total = data_point.expenses.total_gbp
+                net_income = income_total - tax_total
+                savings = net_income - expenses_total
 
                 print(f"{data_point.year:<6} {data_point.age:<4} {data_point.jurisdiction.value:<12} "
-                      f"£{data_point.income.total_gbp:>7,.0f}    "
-                      f"£{data_point.tax.total_gbp:>6,.0f}   "
+                      f"£{income_total:>7,.0f}    "
+                      f"£{tax_total:>6,.0f}   "
                       f"£{net_income:>7,.0f}    "
-                      f"£{data_point.expenses.total_gbp:>7,.0f}    "
+                      f"£{expenses_total:>7,.0f}    "
                       f"£{savings:>7,.0f}    "
                       f"£{data_point.net_worth.total_gbp:>7,.0f}")
 
@@ -98,11 +101,12 @@ class ScenarioDetailViewer:
             print(f"{'-'*70}")
 
             for data_point in result.data_points:
+                income = data_point.income
                 print(f"{data_point.year:<6} "
-                      f"£{data_point.income.salary.gbp_value:>7,.0f}    "
-                      f"£{data_point.income.bonus.gbp_value:>7,.0f}    "
-                      f"£{data_point.income.rsu_vested.gbp_value:>7,.0f}    "
-                      f"£{data_point.income.total_gbp:>7,.0f}")
+                      f"£{income.salary.gbp_value:>7,.0f}    "
+                      f"£{income.bonus.gbp_value:>7,.0f}    "
+                      f"£{income.rsu_vested.gbp_value:>7,.0f}    "
+                      f"£{income.total_gbp:>7,.0f}")
 
             print(f"{'='*70}")
 
@@ -0,0 +1,172 @@
+"""Disk cache entries must be invalidated by any edit to their inputs."""
+
+import os
+import shutil
+
+import pytest
+
+import analyze_all_scenarios
+from config import disk_cache, template_engine
+from config.template_engine import GenericCalculationEngine, TemplateEngine
+
+SCENARIO_ID = 'uk_scenario_a'
+
+
+def _rewrite(path, old, new):
+    """Replace text in a file and move its mtime forward so the edit is always seen."""
+    stat = os.stat(path)
+    path.write_text(path.read_text().replace(old, new))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def config_root(tmp_path):
+    """A private copy of the config tree that tests can edit."""
+    root = tmp_path / 'config'
+    shutil.copytree(disk_cache.PROJECT_ROOT / 'config', root, ignore=shutil.ignore_patterns('*.py', '__pycache__'))
+    return root
+
+
+@pytest.fixture
+def cache_dirs(tmp_path, monkeypatch):
+    """Point the template engine's disk caches at a temporary directory."""
+    monkeypatch.setattr(template_engine, '_YAML_DISK_CACHE_DIR', tmp_path / 'cache' / 'yaml')
+    monkeypatch.setattr(template_engine, '_SCENARIO_DISK_CACHE_DIR', tmp_path / 'cache' / 'resolved_scenarios')
+    return tmp_path / 'cache'
+
+
+def _count_calls(monkeypatch, cls, name):
+    """Wrap a method so the test can see how often it ran."""
+    calls = []
+    original = getattr(cls, name)
+
+    def wrapper(self, *args, **kwargs):
+        calls.append(args)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(cls, name, wrapper)
+    return calls
+
+
+def test_round_trip_and_invalidation(tmp_path):
+    source = tmp_path / 'source.py'
+    source.write_text('RATE = 1\n')
+    directory = tmp_path / 'cache'
+
+    assert disk_cache.load(directory, 'entry', disk_cache.fingerprint([source])) is disk_cache.MISS
+    assert disk_cache.store(directory, 'entry', disk_cache.fingerprint([source]), {'value': [1, 2]})
+    assert disk_cache.load(directory, 'entry', disk_cache.fingerprint([source])) == {'value': [1, 2]}
+
+    # A same-size edit still changes the fingerprint
+    _rewrite(source, '1', '2')
+    assert disk_cache.load(directory, 'entry', disk_cache.fingerprint([source])) is disk_cache.MISS
+
+
+def test_fingerprint_covers_extra_parts_and_paths(tmp_path):
+    first, second = tmp_path / 'a.yaml', tmp_path / 'b.yaml'
+    first.write_text('x: 1\n')
+    second.write_text('x: 1\n')
+
+    assert disk_cache.fingerprint([first]) != disk_cache.fingerprint([second])
+    assert disk_cache.fingerprint([first], 'root-a') != disk_cache.fingerprint([first], 'root-b')
+
+
+def test_store_replaces_entry_and_reads_corrupt_file_as_miss(tmp_path):
+    directory = tmp_path / 'cache'
+    disk_cache.store(directory, 'examples/demo', 'old', 1)
+    disk_cache.store(directory, 'examples/demo', 'new', 2)
+
+    assert [path.name for path in directory.iterdir()] == ['examples__demo.pkl']
+    assert disk_cache.load(directory, 'examples/demo', 'new') == 2
+
+    disk_cache.entry_path(directory, 'examples/demo').write_bytes(b'not a pickle')
+    assert disk_cache.load(directory, 'examples/demo', 'new') is disk_cache.MISS
+
+
+def test_resolved_scenario_cache_is_opt_in(config_root, cache_dirs):
+    TemplateEngine(str(config_root)).load_scenario(SCENARIO_ID)
+    assert not (cache_dirs / 'resolved_scenarios').exists()
+
+
+def test_resolved_scenario_cache_invalidated_by_yaml_edit(config_root, cache_dirs, monkeypatch):
+    first = TemplateEngine(str(config_root), persistent_cache=True).load_scenario(SCENARIO_ID)
+    resolves = _count_calls(monkeypatch, TemplateEngine, '_resolve_scenario')
+
+    # A fresh engine reuses the stored config
+    assert TemplateEngine(str(config_root), persistent_cache=True).load_scenario(SCENARIO_ID) == first
+    assert resolves == []
+
+    _rewrite(config_root / 'scenarios' / f'{SCENARIO_ID}.yaml',
+             'UK Conservative Growth Scenario', 'UK Conservative Growth Scenario (edited)')
+    edited = TemplateEngine(str(config_root), persistent_cache=True).load_scenario(SCENARIO_ID)
+    assert len(resolves) == 1
+    assert edited.scenario_metadata['name'] == 'UK Conservative Growth Scenario (edited)'
+
+
+def test_resolved_scenario_cache_invalidated_by_source_edit(config_root, cache_dirs, tmp_path, monkeypatch):
+    source = tmp_path / 'rules.py'
+    source.write_text('RATE = 1\n')
+    monkeypatch.setattr(disk_cache, 'source_files', lambda: [source])
+
+    TemplateEngine(str(config_root), persistent_cache=True).load_scenario(SCENARIO_ID)
+    resolves = _count_calls(monkeypatch, TemplateEngine, '_resolve_scenario')
+    TemplateEngine(str(config_root), persistent_cache=True).load_scenario(SCENARIO_ID)
+    assert resolves == []
+
+    _rewrite(source, '1', '2')
+    TemplateEngine(str(config_root), persistent_cache=True).load_scenario(SCENARIO_ID)
+    assert len(resolves) == 1
+
+
+def test_result_cache_invalidated_by_config_edit(config_root, cache_dirs, monkeypatch):
+    result_dir = cache_dirs / 'scenarios'
+    first = analyze_all_scenarios.ScenarioAnalyzer(str(config_root), str(result_dir)).analyze_scenario(SCENARIO_ID)
+    assert isinstance(first, analyze_all_scenarios.ScenarioResult)
+    calculations = _count_calls(monkeypatch, GenericCalculationEngine, 'calculate_scenario')
+
+    cached = analyze_all_scenarios.ScenarioAnalyzer(str(config_root), str(result_dir)).analyze_scenario(SCENARIO_ID)
+    assert calculations == []
+    assert cached.summary == first.summary
+
+    _rewrite(config_root / 'scenarios' / f'{SCENARIO_ID}.yaml',
+             'UK Conservative Growth Scenario', 'UK Conservative Growth Scenario (edited)')
+    edited = analyze_all_scenarios.ScenarioAnalyzer(str(config_root), str(result_dir)).analyze_scenario(SCENARIO_ID)
+    assert len(calculations) == 1
+    assert edited.name == 'UK Conservative Growth Scenario (edited)'
+
+
+def test_result_cache_invalidated_by_source_edit(config_root, cache_dirs, tmp_path, monkeypatch):
+    source = tmp_path / 'tax_utils.py'
+    source.write_text('RATE = 1\n')
+    monkeypatch.setattr(disk_cache, 'source_files', lambda: [source])
+    result_dir = cache_dirs / 'scenarios'
+
+    analyze_all_scenarios.ScenarioAnalyzer(str(config_root), str(result_dir)).analyze_scenario(SCENARIO_ID)
+    calculations = _count_calls(monkeypatch, GenericCalculationEngine, 'calculate_scenario')
+    analyze_all_scenarios.ScenarioAnalyzer(str(config_root), str(result_dir)).analyze_scenario(SCENARIO_ID)
+    assert calculations == []
+
+    _rewrite(source, '1', '2')
+    analyze_all_scenarios.ScenarioAnalyzer(str(config_root), str(result_dir)).analyze_scenario(SCENARIO_ID)
+    assert len(calculations) == 1
+
+
+def test_source_files_cover_calculation_path():
+    sources = {path.relative_to(disk_cache.PROJECT_ROOT).as_posix() for path in disk_cache.source_files()}
+    assert {'config/template_engine.py', 'config/yaml_loader.py', 'models/unified_helpers.py',
+            'models/unified_financial_data.py', 'utils/tax/tax_utils.py'} <= sources
+
+
+def test_result_cache_write_failure_is_logged(config_root, cache_dirs, caplog):
+    # A file where the cache directory should be makes every write fail
+    blocked = cache_dirs / 'blocked'
+    blocked.parent.mkdir(parents=True, exist_ok=True)
+    blocked.write_text('')
+
+    analyzer = analyze_all_scenarios.ScenarioAnalyzer(str(config_root), str(blocked))
+    with caplog.at_level('WARNING', logger=analyze_all_scenarios.__name__):
+        result = analyzer.analyze_scenario(SCENARIO_ID)
+
+    assert isinstance(result, analyze_all_scenarios.ScenarioResult)
+    assert f'Could not cache {SCENARIO_ID}' in caplog.text
+    assert caplog.records[-1].exc_info is not None
@@ -0,0 +1,37 @@
+"""Name-based scenario attributes come from one ordered substring scan."""
+
+import pytest
+
+from components.utils import (
+    get_scenario_category,
+    get_scenario_color,
+    get_scenario_housing_strategy,
+    get_scenario_relocation_timing,
+    get_scenario_tax_status,
+)
+
+
+@pytest.mark.parametrize('name, color, category, tax_status, housing_strategy, relocation_timing', [
+    ('UK_Scenario_A', '#1f77b4', 'UK', 'Taxed', 'N/A', 'N/A'),
+    ('UK_Scenario_B', '#ff7f0e', 'UK', 'Taxed', 'N/A', 'N/A'),
+    ('Seattle_Year4_UK_Home', '#2ca02c', 'Seattle', 'Taxed', 'UK Home', 'Year 4 (3 UK years)'),
+    ('Seattle_Year5_Local_Home', '#8c564b', 'Seattle', 'Taxed', 'Local Home', 'Year 5 (4 UK years)'),
+    ('New_York_Year4_Local_Home', '#7f7f7f', 'New York', 'Taxed', 'Local Home', 'Year 4 (3 UK years)'),
+    ('New_York_Year5_UK_Home', '#bcbd22', 'New York', 'Taxed', 'UK Home', 'Year 5 (4 UK years)'),
+    ('Dubai_Year4_UK_Home', '#ff9896', 'Dubai', 'Tax-Free', 'UK Home', 'Year 4 (3 UK years)'),
+    ('Dubai_Year5_Local_Home', '#c5b0d5', 'Dubai', 'Tax-Free', 'Local Home', 'Year 5 (4 UK years)'),
+    # Tokens match anywhere in the name, not only after an underscore
+    ('SeattleYear4UK_Home', '#2ca02c', 'Seattle', 'Taxed', 'UK Home', 'Year 4 (3 UK years)'),
+    ('DubaiYear5Local_Home', '#c5b0d5', 'Dubai', 'Tax-Free', 'Local Home', 'Year 5 (4 UK years)'),
+    # With two location tokens the scan order decides, not their position
+    ('Dubai_to_Seattle_Year4_UK_Home', '#2ca02c', 'Seattle', 'Tax-Free', 'UK Home', 'Year 4 (3 UK years)'),
+    ('Custom_Plan', '#636363', 'Other', 'Taxed', 'N/A', 'N/A'),
+])
+def test_scenario_attributes(name, color, category, tax_status, housing_strategy, relocation_timing):
+    # Asked twice so the memoized result is checked as well as the first one
+    for _ in range(2):
+        assert get_scenario_color(name) == color
+        assert get_scenario_category(name) == category
+        assert get_scenario_tax_status(name) == tax_status
+        assert get_scenario_housing_strategy(name) == housing_strategy
+        assert get_scenario_relocation_timing(name) == relocation_timing
@@ -0,0 +1,47 @@
+"""The array tax functions must match the scalar ones value for value."""
+
+import numpy as np
+import pytest
+
+from utils.tax.tax_utils import (
+    calculate_yaml_tax_for_location,
+    calculate_yaml_tax_for_location_vec,
+)
+
+TAX_SYSTEMS = ['uk_income_tax_ni', 'us_federal', 'us_california', 'us_washington', 'tax_free']
+
+# Band edges (personal allowance, NI thresholds, taper, higher and additional
+# rate limits) plus values on either side of them
+INCOMES = np.array([
+    0.0, 1.0, 12570.0, 12571.0, 28470.0, 28471.0, 50270.0, 50271.0, 75000.0,
+    100000.0, 100001.0, 125140.0, 125141.0, 250000.0, 1_234_567.89,
+])
+
+
+def _random_incomes():
+    rng = np.random.default_rng(20251017)
+    return np.concatenate([INCOMES, rng.uniform(0, 300_000, size=200)])
+
+
+@pytest.mark.parametrize('tax_system_id', TAX_SYSTEMS)
+@pytest.mark.parametrize('loan_balance', [0.0, 5_000.0, 60_000.0])
+def test_vec_matches_scalar(tax_system_id, loan_balance):
+    incomes = _random_incomes()
+    vec = calculate_yaml_tax_for_location_vec(incomes, tax_system_id, loan_balance=loan_balance)
+
+    for i, income in enumerate(incomes.tolist()):
+        scalar = calculate_yaml_tax_for_location(income, tax_system_id, 2025, loan_balance=loan_balance)
+        for key in ('income_tax', 'social_security', 'student_loan', 'total_tax'):
+            assert vec[key][i] == scalar[key], (key, income)
+
+
+def test_vec_returns_float64_arrays():
+    result = calculate_yaml_tax_for_location_vec(INCOMES, 'uk_income_tax_ni')
+    for values in result.values():
+        assert values.dtype == np.float64
+        assert values.shape == INCOMES.shape
+
+
+def test_vec_rejects_unknown_tax_system():
+    with pytest.raises(ValueError):
+        calculate_yaml_tax_for_location_vec(INCOMES, 'not_a_tax_system')
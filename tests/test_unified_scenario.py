@@ -0,0 +1,72 @@
+"""UnifiedFinancialScenario must behave the same whether its years are columnar or materialized."""
+
+import pickle
+
+import pytest
+
+from config import template_engine
+from config.template_engine import GenericCalculationEngine, TemplateEngine
+from models.unified_financial_data import Currency, UnifiedFinancialScenario
+
+
+@pytest.fixture(scope='module')
+def calculator():
+    return GenericCalculationEngine(TemplateEngine('config'))
+
+
+def _calculate(calculator, scenario_id='uk_scenario_a', materialize=False):
+    """Calculate a scenario, optionally building its data points right away."""
+    scenario = calculator.calculate_scenario_from_templates(scenario_id)
+    if materialize:
+        assert scenario.data_points
+    return scenario
+
+
+def test_fresh_calculations_compare_equal(calculator):
+    assert _calculate(calculator) == _calculate(calculator)
+
+
+def test_pending_equals_materialized(calculator):
+    pending, materialized = _calculate(calculator), _calculate(calculator, materialize=True)
+
+    assert pending == materialized
+    assert materialized == pending
+
+
+def test_different_scenarios_compare_unequal(calculator):
+    first, second = _calculate(calculator), _calculate(calculator, 'uk_scenario_b')
+    assert first != second
+
+    renamed = _calculate(calculator)
+    renamed.name = 'renamed'
+    assert renamed != first
+
+
+def test_rebuilt_from_data_points_compares_equal(calculator):
+    scenario = _calculate(calculator)
+    rebuilt = UnifiedFinancialScenario(name=scenario.name, description=scenario.description, phase=scenario.phase,
+                                       metadata=scenario.metadata, data_points=_calculate(calculator).data_points)
+    assert rebuilt == scenario
+
+
+@pytest.mark.parametrize('materialize', [False, True])
+def test_pickle_round_trip(calculator, materialize):
+    scenario = _calculate(calculator, materialize=materialize)
+    assert pickle.loads(pickle.dumps(scenario)) == _calculate(calculator)
+
+
+def test_dump_matches_between_pending_and_materialized(calculator):
+    materialized = _calculate(calculator, materialize=True)
+    assert _calculate(calculator).model_dump() == materialized.model_dump()
+
+
+def test_default_exchange_rates_are_read_only_and_copied_per_year(calculator):
+    scenario = _calculate(calculator, materialize=True)
+
+    with pytest.raises(TypeError):
+        template_engine._DEFAULT_EXCHANGE_RATES[Currency.USD] = 2.0
+
+    first, second = scenario.data_points[0].exchange_rates, scenario.data_points[1].exchange_rates
+    assert first == dict(template_engine._DEFAULT_EXCHANGE_RATES)
+    first[Currency.USD] = 2.0
+    assert second[Currency.USD] == template_engine._DEFAULT_EXCHANGE_RATES[Currency.USD]
@@ -0,0 +1,13 @@
+"""Parsed YAML is cached, but callers must never share the cached objects."""
+
+from config import yaml_loader
+
+
+def test_mutating_a_loaded_scenario_does_not_leak_into_later_loads():
+    first = yaml_loader.try_load_scenario('uk_scenario_a')
+    original_name = first['scenario']['name']
+
+    first['scenario']['name'] = 'mutated'
+    first.clear()
+
+    assert yaml_loader.try_load_scenario('uk_scenario_a')['scenario']['name'] == original_name
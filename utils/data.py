@@ -15,7 +15,7 @@ from pathlib import Path
 
 # Import the new template-driven financial planner
 from financial_planner_template_driven import TemplateFinancialPlanner
-from config.template_engine import TemplateEngine, GenericCalculationEngine
+from config.template_engine import TemplateEngine, GenericCalculationEngine, clear_yaml_cache
 
 # Import unified models and helpers
 from models.unified_financial_data import (
@@ -27,6 +27,21 @@ from models.unified_helpers import (
     clear_performance_caches
 )
 
+# Scenario ID fragments that mark an international (non-UK) location
+INTERNATIONAL_LOCATIONS = ('seattle', 'new_york', 'dubai')
+
+
+@st.cache_resource
+def get_shared_planner() -> TemplateFinancialPlanner:
+    """Planner shared across reruns and sessions (it only holds the template engine)."""
+    return TemplateFinancialPlanner()
+
+
+@st.cache_data(ttl=3600)
+def get_available_scenarios() -> List[str]:
+    """Available scenario IDs, discovered once rather than on every rerun."""
+    return get_shared_planner().get_available_scenarios()
+
 
 @st.cache_data(ttl=300, max_entries=10)
 def load_all_scenarios() -> Dict[str, UnifiedFinancialScenario]:
@@ -550,16 +565,44 @@ def calculate_key_metrics(scenarios: Dict[str, UnifiedFinancialScenario]) -> Dic
     return metrics
 
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_scenario_id_groups() -> Dict[str, frozenset]:
+    """
+    Group the available scenario IDs by the ID patterns the sidebar quick filters use.
+
+    Cheap (IDs only, no scenario loading), so filters can use it without the
+    enriched metadata.
+
+    Returns:
+        Dict of frozensets: all_scenarios_set, uk_set, international_set,
+        tax_free_set and multi_phase_set
+    """
+    scenario_ids = get_available_scenarios()
+    lowered = [(scenario_id, scenario_id.lower()) for scenario_id in scenario_ids]
+
+    return {
+        'all_scenarios_set': frozenset(scenario_ids),
+        'uk_set': frozenset(sid for sid, low in lowered if 'uk' in low),
+        'international_set': frozenset(
+            sid for sid, low in lowered if any(loc in low for loc in INTERNATIONAL_LOCATIONS)
+        ),
+        'tax_free_set': frozenset(sid for sid, low in lowered if 'dubai' in low),
+        'multi_phase_set': frozenset(sid for sid, low in lowered if 'year' in low),
+    }
+
+
+@st.cache_data(ttl=600, max_entries=5, show_spinner=False)
 def get_scenario_metadata() -> Dict[str, Any]:
     """
     Get metadata about all available scenarios with proper ID/name mapping.
 
     Returns:
-        Dictionary containing scenario metadata and mappings
+        Dictionary containing scenario metadata and mappings, plus frozensets
+        of the scenario IDs (all, UK, international, tax-free, multi-phase)
+        for O(1) membership tests
     """
     try:
-        planner = TemplateFinancialPlanner()
-        scenario_ids = planner.get_available_scenarios()
+        scenario_ids = get_available_scenarios()
 
         # Get enriched metadata for mapping
         enriched_metadata = get_enriched_scenario_metadata()
@@ -586,6 +629,7 @@ def get_scenario_metadata() -> Dict[str, Any]:
 
         return {
             'all_scenarios': all_scenarios,  # Use IDs for consistency
+            **get_scenario_id_groups(),
             'id_to_name': id_to_name,
             'name_to_id': name_to_id,
             'scenario_count': len(scenario_ids),
@@ -596,6 +640,11 @@ def get_scenario_metadata() -> Dict[str, Any]:
         st.error(f"Failed to get scenario metadata: {str(e)}")
     return {
             'all_scenarios': [],
+            'all_scenarios_set': frozenset(),
+            'uk_set': frozenset(),
+            'international_set': frozenset(),
+            'tax_free_set': frozenset(),
+            'multi_phase_set': frozenset(),
             'id_to_name': {},
             'name_to_id': {},
             'scenario_count': 0,
@@ -681,12 +730,16 @@ def clear_cache():
     """Clear all cached data including performance caches."""
     try:
         # Clear Streamlit caches
+        get_available_scenarios.clear()
+        get_scenario_id_groups.clear()
+        get_scenario_metadata.clear()
         load_all_scenarios.clear()
         get_enriched_scenario_metadata.clear()
         validate_all_scenarios.clear()
         get_template_configuration_summary.clear()
 
-        # Clear performance caches if available
+        # Clear parsed YAML templates and performance caches
+        clear_yaml_cache()
         clear_performance_caches()
     except Exception:
         # Ignore cache clearing errors
@@ -7,6 +7,8 @@ from typing import Dict, Tuple, Any
 import sys
 import os
 
+import numpy as np
+
 # Import tax modules from the same directory
 from .uk_tax import calculate_uk_tax_ni, calculate_uk_student_loan
 from .us_tax import calculate_us_tax
@@ -437,4 +439,135 @@ def calculate_tax_free_from_yaml(gross_income: float, tax_config: Dict[str, Any]
         'social_security': 0,
         'student_loan': 0,
         'total_tax': 0
-    } 
\ No newline at end of file
+    }
+
+
+def calculate_yaml_tax_for_location_vec(
+    gross_income: np.ndarray,
+    tax_system_id: str,
+    loan_balance: float = 0.0
+) -> Dict[str, np.ndarray]:
+    """
+    Array variant of calculate_yaml_tax_for_location for a run of years.
+
+    The tax system is loaded once and every band is evaluated across the
+    whole array, giving the same values as calling the scalar function
+    year by year. No tax system reads the tax year yet, so unlike the scalar
+    function this one takes no years.
+
+    Args:
+        gross_income: Annual gross income in GBP, one entry per year
+        tax_system_id: YAML tax system identifier (e.g., 'uk_income_tax_ni')
+        loan_balance: Student loan balance (for UK)
+
+    Returns:
+        Dictionary of float64 arrays with the same keys as the scalar version
+    """
+
+    if not YAML_TAX_SUPPORT:
+        raise ValueError("YAML tax support not available")
+
+    tax_config = try_load_tax_system(tax_system_id)
+    if not tax_config:
+        raise ValueError(f"Could not load tax system: {tax_system_id}")
+
+    gross_income = np.asarray(gross_income, dtype=np.float64)
+    if tax_system_id == 'uk_income_tax_ni':
+        return calculate_uk_tax_from_yaml_vec(gross_income, tax_config, loan_balance)
+    elif tax_system_id.startswith('us_'):
+        return calculate_us_tax_from_yaml_vec(gross_income, tax_config)
+    elif tax_system_id == 'tax_free':
+        return calculate_tax_free_from_yaml_vec(gross_income, tax_config)
+    else:
+        raise ValueError(f"Unsupported tax system: {tax_system_id}")
+
+
+def calculate_uk_tax_from_yaml_vec(gross_income: np.ndarray, tax_config: Dict[str, Any],
+                                   loan_balance: float = 0.0) -> Dict[str, np.ndarray]:
+    """Array variant of calculate_uk_tax_from_yaml; bands are applied with masks in the same order."""
+
+    income_tax_config = tax_config.get('income_tax', {})
+    ni_config = tax_config.get('national_insurance', {})
+    student_loan_config = tax_config.get('student_loan', {})
+
+    bands = income_tax_config.get('bands', {})
+    rates = income_tax_config.get('rates', {})
+    ni_bands = ni_config.get('bands', {})
+    ni_rates = ni_config.get('rates', {})
+
+    zeros = np.zeros_like(gross_income)
+
+    # Personal Allowance with taper
+    pa_taper_threshold = bands.get('pa_taper_threshold', 100000)
+    pa = np.full_like(gross_income, bands.get('personal_allowance', 12570))
+    tapered = gross_income > pa_taper_threshold
+    pa[tapered] = np.maximum(0, pa[tapered] - (gross_income[tapered] - pa_taper_threshold) / 2)
+
+    # Calculate Income Tax, peeling off the additional and higher rate bands first
+    taxable_income = np.maximum(0, gross_income - pa)
+    higher_limit = bands.get('higher_rate_limit', 125140) - pa
+    basic_limit = bands.get('basic_rate_limit', 50270) - pa
+
+    in_additional = taxable_income > higher_limit
+    additional_tax = np.where(in_additional, (taxable_income - higher_limit) * rates.get('additional', 0.45), zeros)
+    taxable_income = np.where(in_additional, higher_limit, taxable_income)
+
+    in_higher = taxable_income > basic_limit
+    higher_tax = np.where(in_higher, (taxable_income - basic_limit) * rates.get('higher', 0.40), zeros)
+    taxable_income = np.where(in_higher, basic_limit, taxable_income)
+
+    income_tax = np.where(
+        taxable_income > 0,
+        additional_tax + higher_tax + taxable_income * rates.get('basic', 0.20),
+        zeros
+    )
+
+    # Calculate National Insurance
+    primary_threshold = ni_bands.get('primary_threshold', 12570)
+    upper_earnings_limit = ni_bands.get('upper_earnings_limit', 50270)
+    main_ni = np.maximum(0, np.minimum(gross_income, upper_earnings_limit) - primary_threshold) * ni_rates.get('main', 0.08)
+    upper_ni = np.where(gross_income > upper_earnings_limit,
+                        (gross_income - upper_earnings_limit) * ni_rates.get('upper', 0.02), zeros)
+    national_insurance = np.where(gross_income > primary_threshold, main_ni + upper_ni, zeros)
+
+    # Calculate Student Loan (if applicable)
+    student_loan = zeros
+    if loan_balance > 0 and student_loan_config:
+        threshold = student_loan_config.get('threshold', 28470)
+        repayment = np.minimum((gross_income - threshold) * student_loan_config.get('repayment_rate', 0.09),
+                               loan_balance)
+        student_loan = np.where(gross_income > threshold, repayment, zeros)
+
+    return {
+        'income_tax': income_tax,
+        'social_security': national_insurance,
+        'student_loan': student_loan,
+        'total_tax': income_tax + national_insurance + student_loan
+    }
+
+
+def calculate_us_tax_from_yaml_vec(gross_income: np.ndarray, tax_config: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    """Array variant of calculate_us_tax_from_yaml."""
+
+    federal_tax = gross_income * tax_config.get('federal', {}).get('effective_rate', 0.22)
+    state_tax = gross_income * tax_config.get('state', {}).get('rate', 0.0)
+    fica_tax = gross_income * 0.0765
+
+    return {
+        'income_tax': federal_tax + state_tax,
+        'social_security': fica_tax,
+        'student_loan': np.zeros_like(gross_income),
+        'total_tax': federal_tax + state_tax + fica_tax
+    }
+
+
+def calculate_tax_free_from_yaml_vec(gross_income: np.ndarray, tax_config: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    """Array variant of calculate_tax_free_from_yaml."""
+
+    zeros = np.zeros_like(gross_income)
+    return {
+        'income_tax': zeros,
+        'social_security': zeros,
+        'student_loan': zeros,
+        'total_tax': zeros
+    }
@@ -5,18 +5,22 @@ Handles all UK-specific tax calculations including Income Tax, National Insuranc
 
 def calculate_uk_tax_ni(gross_income, year, config):
     """Calculates UK Income Tax and National Insurance for a given year."""
+    bands = config["tax_bands"]
+    rates = config["tax_rates"]
+    ni_bands = config["ni_bands"]
+    ni_rates = config["ni_rates"]
+
     # Adjust thresholds for inflation after the freeze
-    if year >= config["tax_bands"]["threshold_freeze_until"]:
-        inflation_multiplier = (1 + config["inflation_rate"]) ** (year - config["tax_bands"]["threshold_freeze_until"])
-        pa = config["tax_bands"]["personal_allowance"] * inflation_multiplier
-        br_limit = config["tax_bands"]["basic_rate_limit"] * inflation_multiplier
-        hr_limit = config["tax_bands"]["higher_rate_limit"] * inflation_multiplier
-        pa_taper_threshold = config["tax_bands"]["pa_taper_threshold"] * inflation_multiplier
-    else:
-        pa = config["tax_bands"]["personal_allowance"]
-        br_limit = config["tax_bands"]["basic_rate_limit"]
-        hr_limit = config["tax_bands"]["higher_rate_limit"]
-        pa_taper_threshold = config["tax_bands"]["pa_taper_threshold"]
+    pa = bands["personal_allowance"]
+    br_limit = bands["basic_rate_limit"]
+    hr_limit = bands["higher_rate_limit"]
+    pa_taper_threshold = bands["pa_taper_threshold"]
+    if year >= bands["threshold_freeze_until"]:
+        inflation_multiplier = (1 + config["inflation_rate"]) ** (year - bands["threshold_freeze_until"])
+        pa *= inflation_multiplier
+        br_limit *= inflation_multiplier
+        hr_limit *= inflation_multiplier
+        pa_taper_threshold *= inflation_multiplier
     
     # Personal Allowance Taper
     if gross_income > pa_taper_threshold:
@@ -29,21 +33,23 @@ def calculate_uk_tax_ni(gross_income, year, config):
     # Income Tax
     if taxable_income > 0:
         if taxable_income > hr_limit - pa:
-            tax += (taxable_income - (hr_limit - pa)) * config["tax_rates"]["additional"]
+            tax += (taxable_income - (hr_limit - pa)) * rates["additional"]
             taxable_income = hr_limit - pa
         if taxable_income > br_limit - pa:
-            tax += (taxable_income - (br_limit - pa)) * config["tax_rates"]["higher"]
+            tax += (taxable_income - (br_limit - pa)) * rates["higher"]
             taxable_income = br_limit - pa
-        tax += taxable_income * config["tax_rates"]["basic"]
+        tax += taxable_income * rates["basic"]
 
     # National Insurance
     ni = 0
-    if gross_income > config["ni_bands"]["primary_threshold"]:
-        niable_income_main = min(gross_income, config["ni_bands"]["upper_earnings_limit"]) - config["ni_bands"]["primary_threshold"]
-        ni += max(0, niable_income_main) * config["ni_rates"]["main"]
-    if gross_income > config["ni_bands"]["upper_earnings_limit"]:
-        niable_income_upper = gross_income - config["ni_bands"]["upper_earnings_limit"]
-        ni += niable_income_upper * config["ni_rates"]["upper"]
+    primary_threshold = ni_bands["primary_threshold"]
+    upper_earnings_limit = ni_bands["upper_earnings_limit"]
+    if gross_income > primary_threshold:
+        niable_income_main = min(gross_income, upper_earnings_limit) - primary_threshold
+        ni += max(0, niable_income_main) * ni_rates["main"]
+    if gross_income > upper_earnings_limit:
+        niable_income_upper = gross_income - upper_earnings_limit
+        ni += niable_income_upper * ni_rates["upper"]
 
     return tax, ni
 